@@ -3,43 +3,47 @@ Configuration Module
 Manages bot settings and credentials
 """
 import os
-from typing import List
+from dataclasses import dataclass
+from functools import cache
+from typing import Tuple
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
 
-
-class Config:
+@dataclass(frozen=True)
+class _Config:
     """Bot configuration settings"""
     
     # Telegram Settings
-    TELEGRAM_BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN', '')
-    TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID', '')
+    TELEGRAM_BOT_TOKEN: str
+    TELEGRAM_CHAT_ID: str
+    TELEGRAM_PLAIN_TEXT: bool
     
     # Exchange Settings (oanda for forex, binance for crypto)
-    EXCHANGE = os.getenv('EXCHANGE', 'oanda')
+    EXCHANGE: str
     
     # Trading Symbols to Monitor (GOLD forex pairs)
-    SYMBOLS = os.getenv('SYMBOLS', 'XAU/USD,XAU/EUR').split(',')
+    SYMBOLS: Tuple[str, ...]
     
     # Timeframes to Monitor (in minutes)
-    TIMEFRAMES = os.getenv('TIMEFRAMES', '15m,1h,4h').split(',')
+    TIMEFRAMES: Tuple[str, ...]
     
     # Pattern Detection Settings
-    PATTERN_TOLERANCE = float(os.getenv('PATTERN_TOLERANCE', '0.02'))  # 2% default
-    MIN_BARS = int(os.getenv('MIN_BARS', '10'))
-    LOOKBACK_PERIODS = int(os.getenv('LOOKBACK_PERIODS', '100'))
+    PATTERN_TOLERANCE: float
+    MIN_BARS: int
+    LOOKBACK_PERIODS: int
+    DETECTION_WORKERS: int
+    TICK_SIZE: float
     
     # Bot Settings
-    SCAN_INTERVAL = int(os.getenv('SCAN_INTERVAL', '60'))  # seconds
-    MIN_CONFIDENCE = float(os.getenv('MIN_CONFIDENCE', '0.7'))  # 70% minimum
+    PRICE_CACHE_TTL: int
+    MIN_CONFIDENCE: float
+    MAX_CONCURRENT_SCANS: int
+    USE_IO_URING: bool
     
     # Logging
-    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+    LOG_LEVEL: str
     
-    @classmethod
-    def validate(cls) -> bool:
+    def validate(self) -> bool:
         """
         Validate configuration
         
@@ -48,18 +52,27 @@ class Config:
         """
         errors = []
         
-        if not cls.TELEGRAM_BOT_TOKEN:
+        if not self.TELEGRAM_BOT_TOKEN:
             errors.append("TELEGRAM_BOT_TOKEN is not set")
         
-        if not cls.TELEGRAM_CHAT_ID:
+        if not self.TELEGRAM_CHAT_ID:
             errors.append("TELEGRAM_CHAT_ID is not set")
         
-        if not cls.SYMBOLS:
+        if not self.SYMBOLS:
             errors.append("No symbols configured")
         
-        if not cls.TIMEFRAMES:
+        if not self.TIMEFRAMES:
             errors.append("No timeframes configured")
         
+        if self.MAX_CONCURRENT_SCANS < 1:
+            errors.append("MAX_CONCURRENT_SCANS must be at least 1")
+        
+        if self.TICK_SIZE < 0:
+            errors.append("TICK_SIZE must not be negative")
+        
+        if self.DETECTION_WORKERS < 1:
+            errors.append("DETECTION_WORKERS must be at least 1")
+        
         if errors:
             print("Configuration errors:")
             for error in errors:
@@ -68,18 +81,56 @@ class Config:
         
         return True
     
-    @classmethod
-    def display(cls):
+    def display(self):
         """Display current configuration (without sensitive data)"""
-        print("\n" + "="*50)
-        print("REVERSAL BOT CONFIGURATION")
-        print("="*50)
-        print(f"Exchange: {cls.EXCHANGE}")
-        print(f"Symbols: {', '.join(cls.SYMBOLS)}")
-        print(f"Timeframes: {', '.join(cls.TIMEFRAMES)}")
-        print(f"Pattern Tolerance: {cls.PATTERN_TOLERANCE * 100}%")
-        print(f"Min Confidence: {cls.MIN_CONFIDENCE * 100}%")
-        print(f"Scan Interval: {cls.SCAN_INTERVAL}s")
-        print(f"Lookback Periods: {cls.LOOKBACK_PERIODS}")
-        print(f"Telegram Configured: {'✓' if cls.TELEGRAM_BOT_TOKEN else '✗'}")
-        print("="*50 + "\n")
+        rule = "=" * 50
+        print(
+            f"\n{rule}\n"
+            f"REVERSAL BOT CONFIGURATION\n"
+            f"{rule}\n"
+            f"Exchange: {self.EXCHANGE}\n"
+            f"Symbols: {', '.join(self.SYMBOLS)}\n"
+            f"Timeframes: {', '.join(self.TIMEFRAMES)}\n"
+            f"Pattern Tolerance: {self.PATTERN_TOLERANCE * 100}%\n"
+            f"Min Confidence: {self.MIN_CONFIDENCE * 100}%\n"
+            f"Scans: at each candle close (price cache {self.PRICE_CACHE_TTL}s)\n"
+            f"Max Concurrent Scans: {self.MAX_CONCURRENT_SCANS}\n"
+            f"Lookback Periods: {self.LOOKBACK_PERIODS}\n"
+            f"Detection Workers: {self.DETECTION_WORKERS}\n"
+            f"Telegram Configured: {'✓' if self.TELEGRAM_BOT_TOKEN else '✗'}\n"
+            f"{rule}\n"
+        )
+
+
+@cache
+def get_config() -> _Config:
+    """
+    Load configuration from the environment (and .env file) once
+    
+    Returns:
+        Parsed, immutable configuration shared by the whole process
+    """
+    load_dotenv()
+    
+    return _Config(
+        TELEGRAM_BOT_TOKEN=os.getenv('TELEGRAM_BOT_TOKEN', ''),
+        TELEGRAM_CHAT_ID=os.getenv('TELEGRAM_CHAT_ID', ''),
+        TELEGRAM_PLAIN_TEXT=os.getenv('TELEGRAM_PLAIN_TEXT', 'false').lower() in ('1', 'true', 'yes'),
+        EXCHANGE=os.getenv('EXCHANGE', 'oanda'),
+        SYMBOLS=tuple(os.getenv('SYMBOLS', 'XAU/USD,XAU/EUR').split(',')),
+        TIMEFRAMES=tuple(os.getenv('TIMEFRAMES', '15m,1h,4h').split(',')),
+        PATTERN_TOLERANCE=float(os.getenv('PATTERN_TOLERANCE', '0.02')),  # 2% default
+        MIN_BARS=int(os.getenv('MIN_BARS', '10')),
+        LOOKBACK_PERIODS=int(os.getenv('LOOKBACK_PERIODS', '100')),
+        TICK_SIZE=float(os.getenv('TICK_SIZE', '0')),  # 0 = compare raw prices
+        DETECTION_WORKERS=int(os.getenv('DETECTION_WORKERS', '1')),  # 1 = serial
+        # Seconds a fetched ticker price is reused (SCAN_INTERVAL is its old name)
+        PRICE_CACHE_TTL=int(os.getenv('PRICE_CACHE_TTL', os.getenv('SCAN_INTERVAL', '60'))),
+        MIN_CONFIDENCE=float(os.getenv('MIN_CONFIDENCE', '0.7')),  # 70% minimum
+        MAX_CONCURRENT_SCANS=int(os.getenv('MAX_CONCURRENT_SCANS', '10')),
+        USE_IO_URING=os.getenv('USE_IO_URING', 'false').lower() in ('1', 'true', 'yes'),
+        LOG_LEVEL=os.getenv('LOG_LEVEL', 'INFO'),
+    )
+
+
+Config = get_config()
@@ -2,85 +2,275 @@
 Data Fetcher Module
 Fetches OHLCV data from cryptocurrency exchanges
 """
-import ccxt
+import asyncio
+import itertools
 import numpy as np
-import pandas as pd
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+import json
 import logging
+import os
 import time
 
+from requests.adapters import HTTPAdapter
+
+from numba_compat import njit
+
+
+OHLCV_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+
+# On-disk cache location for fetched market data
+CACHE_DIR = Path('.cache')
+
+# Lower bound on ccxt's per-request spacing (milliseconds)
+MIN_RATE_LIMIT_MS = 200
+
+# Pooled HTTP connections kept per exchange; sized for the bot's default
+# MAX_CONCURRENT_SCANS so threaded fetches don't discard connections
+HTTP_POOL_SIZE = 10
+
+# How long a cached copy of the exchange markets stays valid (seconds)
+MARKETS_CACHE_TTL = 24 * 60 * 60
+
+# How long a fetched ticker price is reused before re-fetching (seconds)
+PRICE_CACHE_TTL = 60
+
+
+def _exchange_config(exchange_name: str) -> dict:
+    """Build the ccxt constructor config for an exchange"""
+    config = {'enableRateLimit': True}
+    
+    # For forex exchanges like OANDA, don't set defaultType
+    if exchange_name.lower() not in ['oanda', 'fxcm']:
+        config['options'] = {'defaultType': 'spot'}
+    
+    return config
+
+
+# Messages for the non-zero codes returned by _validate_arr
+_VALIDATION_ERRORS = (
+    None,
+    "Data contains NaN values",
+    "Invalid OHLC data: high < low",
+    "Invalid OHLC data: high < close",
+    "Invalid OHLC data: high < open",
+    "Invalid OHLC data: low > close",
+    "Invalid OHLC data: low > open",
+    "Invalid OHLC data: negative volume",
+)
+
+
+@njit(cache=True)
+def _validate_arr(opens, highs, lows, closes, volumes) -> int:
+    """
+    Check OHLCV consistency in a single pass over the bars
+    
+    Returns:
+        0 if valid, otherwise an index into _VALIDATION_ERRORS
+    """
+    for i in range(len(closes)):
+        o = opens[i]
+        h = highs[i]
+        l = lows[i]
+        c = closes[i]
+        v = volumes[i]
+        
+        if not (np.isfinite(o) and np.isfinite(h) and np.isfinite(l)
+                and np.isfinite(c) and np.isfinite(v)):
+            return 1
+        if h < l:
+            return 2
+        if h < c:
+            return 3
+        if h < o:
+            return 4
+        if l > c:
+            return 5
+        if l > o:
+            return 6
+        if v < 0:
+            return 7
+    
+    return 0
+
+
+def _ohlcv_to_array(ohlcv: list) -> np.ndarray:
+    """
+    Convert ccxt OHLCV rows into an (N, 6) float64 array
+    
+    Streams the flattened rows through np.fromiter with a known count,
+    which skips np.asarray's nested-sequence shape discovery. Rows with
+    missing values (None) or an unexpected width fall back to np.asarray.
+    """
+    width = len(OHLCV_COLUMNS)
+    try:
+        flat = np.fromiter(itertools.chain.from_iterable(ohlcv),
+                           dtype=np.float64, count=len(ohlcv) * width)
+    except (TypeError, ValueError):
+        return np.asarray(ohlcv, dtype=np.float64)
+    
+    return flat.reshape(-1, width)
+
+
+def to_dataframe(arr: np.ndarray):
+    """
+    Convert an (N, 6) OHLCV array into a DataFrame for logging or debugging
+    
+    Not used on the scan path, which works on the array columns directly.
+    
+    Args:
+        arr: OHLCV array as returned by fetch_ohlcv
+        
+    Returns:
+        pandas DataFrame with a datetime timestamp column
+    """
+    import pandas as pd
+    
+    # Price/volume columns become a single float64 block over arr (no copy,
+    # no per-column dtype inference); only the timestamp is converted
+    df = pd.DataFrame(arr[:, 1:], columns=OHLCV_COLUMNS[1:], copy=False)
+    df.insert(0, 'timestamp', pd.to_datetime(arr[:, 0].astype(np.int64), unit='ms'))
+    
+    return df
+
 
 class DataFetcher:
     """Fetches market data from exchanges"""
     
-    def __init__(self, exchange_name: str = 'binance'):
+    def __init__(self, exchange_name: str = 'binance',
+                 cache_dir: Optional[Path] = CACHE_DIR,
+                 price_ttl: float = PRICE_CACHE_TTL,
+                 load_markets: bool = True):
         """
         Initialize data fetcher
         
         Args:
             exchange_name: Name of the exchange (default: binance)
+            cache_dir: Directory for cached markets and OHLCV bars (None disables disk cache)
+            price_ttl: Seconds a fetched ticker price is reused (0 disables reuse)
+            load_markets: Load markets now; pass False to call load_markets() later
         """
         self.logger = logging.getLogger(__name__)
         self.exchange_name = exchange_name
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._mem_cache: Dict[Tuple[str, str], np.ndarray] = {}
+        self._buffers: Dict[Tuple[str, str], np.ndarray] = {}
+        self.price_ttl = price_ttl
+        self._price_cache: Dict[str, Tuple[float, float]] = {}
+        
+        # ccxt is imported on first use; its exchange modules are slow to load
+        import ccxt
         
         try:
             exchange_class = getattr(ccxt, exchange_name)
+            self.exchange = exchange_class(_exchange_config(exchange_name))
             
-            # Configure based on exchange type
-            config = {'enableRateLimit': True}
-            
-            # For forex exchanges like OANDA, don't set defaultType
-            if exchange_name.lower() not in ['oanda', 'fxcm']:
-                config['options'] = {'defaultType': 'spot'}
+            # ccxt's throttle spaces real requests by rateLimit ms; keep a
+            # floor for exchanges that advertise an aggressive limit
+            self.exchange.rateLimit = max(self.exchange.rateLimit, MIN_RATE_LIMIT_MS)
             
-            self.exchange = exchange_class(config)
+            # Keep the exchange connection alive across calls so each request
+            # reuses the pooled TLS connection instead of a fresh handshake
+            self.exchange.session.mount(
+                'https://', HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE)
+            )
+            self.exchange.headers['Connection'] = 'keep-alive'
             self.logger.info(f"Connected to {exchange_name} exchange")
             
         except Exception as e:
             self.logger.error(f"Failed to initialize exchange: {e}")
             raise
+        
+        if load_markets:
+            self.load_markets()
+    
+    def load_markets(self):
+        """Load exchange markets once, reusing a recent on-disk copy if present"""
+        path = None
+        if self.cache_dir is not None:
+            path = self.cache_dir / f"markets_{self.exchange_name}.json"
+            try:
+                if time.time() - path.stat().st_mtime < MARKETS_CACHE_TTL:
+                    with open(path) as f:
+                        self.exchange.set_markets(json.load(f))
+                    self.logger.debug(f"Loaded {self.exchange_name} markets from cache")
+                    return
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Ignoring unreadable markets cache {path}: {e}")
+        
+        try:
+            markets = self.exchange.load_markets()
+        except Exception as e:
+            # ccxt retries lazily on the first request that needs markets
+            self.logger.warning(f"Failed to load {self.exchange_name} markets: {e}")
+            return
+        
+        if path is None:
+            return
+        
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w') as f:
+                json.dump(markets, f, default=str)
+        except OSError as e:
+            self.logger.warning(f"Failed to write markets cache {path}: {e}")
     
     def fetch_ohlcv(self, symbol: str, timeframe: str = '1h', 
-                    limit: int = 100) -> Optional[pd.DataFrame]:
+                    limit: int = 100) -> Optional[np.ndarray]:
         """
         Fetch OHLCV data for a symbol
         
+        Bars from previous calls are cached in memory and on disk, so only
+        the candles since the last cached bar are requested. The last cached
+        bar is always re-fetched because it may not have closed yet. Once
+        the cache holds `limit` bars, new bars are rolled into that buffer in
+        place, so the returned array is only valid until the next call for
+        the same symbol and timeframe.
+        
         Args:
             symbol: Trading pair (e.g., 'BTC/USDT')
             timeframe: Candle timeframe (e.g., '1m', '5m', '1h', '1d')
             limit: Number of candles to fetch
             
         Returns:
-            DataFrame with OHLCV data or None if error
+            (N, 6) float64 array with columns [timestamp, open, high, low,
+            close, volume], or None if error
         """
+        import ccxt
+        
         try:
-            # Fetch data from exchange
+            cached = self._load_cached(symbol, timeframe)
+            since = self._delta_since(cached, timeframe, limit)
+            
+            # Fetch data from exchange (only the tail when cache is warm)
             ohlcv = self.exchange.fetch_ohlcv(
                 symbol=symbol,
                 timeframe=timeframe,
+                since=since,
                 limit=limit
             )
             
-            if not ohlcv:
+            if since is not None:
+                arr, changed = self._merge_bars(cached, ohlcv, limit)
+            elif ohlcv:
+                arr = _ohlcv_to_array(ohlcv)
+                changed = cached is None or not np.array_equal(cached, arr)
+                arr = self._into_buffer(symbol, timeframe, arr)
+            else:
+                arr = None
+            
+            if arr is None or len(arr) == 0:
                 self.logger.warning(f"No data received for {symbol} {timeframe}")
                 return None
             
-            # Convert to DataFrame
-            df = pd.DataFrame(
-                ohlcv,
-                columns=['timestamp', 'open', 'high', 'low', 'close', 'volume']
-            )
-            
-            # Convert timestamp to datetime
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            
-            # Convert to numeric types
-            for col in ['open', 'high', 'low', 'close', 'volume']:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
+            self._store_cached(symbol, timeframe, arr, changed)
             
-            self.logger.debug(f"Fetched {len(df)} candles for {symbol} {timeframe}")
-            return df
+            self.logger.debug(f"Fetched {len(ohlcv)} new candles for {symbol} {timeframe}")
+            return arr
             
         except ccxt.NetworkError as e:
             self.logger.error(f"Network error fetching {symbol}: {e}")
@@ -92,6 +282,136 @@ class DataFetcher:
             self.logger.error(f"Unexpected error fetching {symbol}: {e}")
             return None
     
+    def preallocate(self, symbols: List[str], timeframes: List[str], n: int):
+        """
+        Allocate the OHLCV buffer of every symbol/timeframe up front
+        
+        Full fetches of n bars are copied into these buffers, and later
+        incremental updates roll inside them, so steady-state scans
+        allocate no per-pair arrays.
+        
+        Args:
+            symbols: Trading pairs that will be fetched
+            timeframes: Timeframes that will be fetched
+            n: Bars per fetch (the fetch limit)
+        """
+        for symbol in symbols:
+            for timeframe in timeframes:
+                key = (symbol, timeframe)
+                if key not in self._buffers:
+                    self._buffers[key] = np.empty((n, len(OHLCV_COLUMNS)), dtype=np.float64)
+    
+    def _into_buffer(self, symbol: str, timeframe: str, arr: np.ndarray) -> np.ndarray:
+        """Copy bars into the pair's preallocated buffer when the shape fits"""
+        buf = self._buffers.get((symbol, timeframe))
+        if buf is None or buf.shape != arr.shape:
+            return arr
+        
+        buf[...] = arr
+        return buf
+    
+    def _cache_path(self, symbol: str, timeframe: str) -> Path:
+        """Path of the on-disk cache file for a symbol/timeframe"""
+        name = f"{self.exchange_name}_{symbol.replace('/', '_')}_{timeframe}.npy"
+        return self.cache_dir / 'ohlcv' / name
+    
+    def _load_cached(self, symbol: str, timeframe: str) -> Optional[np.ndarray]:
+        """Load cached bars from memory, falling back to disk"""
+        key = (symbol, timeframe)
+        if key in self._mem_cache:
+            return self._mem_cache[key]
+        
+        if self.cache_dir is None:
+            return None
+        
+        path = self._cache_path(symbol, timeframe)
+        if not path.exists():
+            return None
+        
+        try:
+            arr = np.load(path)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable cache {path}: {e}")
+            return None
+        
+        self._mem_cache[key] = arr
+        return arr
+    
+    def _store_cached(self, symbol: str, timeframe: str, arr: np.ndarray,
+                      changed: bool = True):
+        """Store bars in memory and write them to disk if they changed"""
+        self._mem_cache[(symbol, timeframe)] = arr
+        
+        if self.cache_dir is None or not changed:
+            return
+        
+        path = self._cache_path(symbol, timeframe)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp.npy')
+            np.save(tmp_path, arr)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning(f"Failed to write cache {path}: {e}")
+    
+    def _delta_since(self, cached: Optional[np.ndarray], timeframe: str,
+                     limit: int) -> Optional[int]:
+        """
+        Timestamp to fetch from when the cache can be extended
+        
+        Returns:
+            Timestamp (ms) of the last cached bar, or None if a full fetch is needed
+        """
+        if cached is None or len(cached) < limit:
+            return None
+        
+        last_ts = int(cached[-1, 0])
+        tf_ms = self.exchange.parse_timeframe(timeframe) * 1000
+        missing_bars = (self.exchange.milliseconds() - last_ts) // tf_ms
+        
+        # Cache too old to be bridged by a single request
+        if missing_bars >= limit:
+            return None
+        
+        return last_ts
+    
+    @staticmethod
+    def _merge_bars(cached: np.ndarray, ohlcv: list,
+                    limit: int) -> Tuple[np.ndarray, bool]:
+        """
+        Roll newly fetched bars into the cache, newest bars winning
+        
+        When the cache already holds exactly `limit` bars, older bars are
+        shifted down and the new ones written over the tail of the same
+        buffer, so a scan allocates nothing beyond the fetched rows.
+        
+        Returns:
+            Tuple of (merged bars, whether any bar changed)
+        """
+        if not ohlcv:
+            return cached[-limit:], False
+        
+        new = _ohlcv_to_array(ohlcv)
+        
+        # Cached bars strictly older than the first fetched bar survive
+        keep = int(np.searchsorted(cached[:, 0], new[0, 0]))
+        
+        if len(cached) != limit or keep + len(new) < limit:
+            merged = np.concatenate((cached[:keep], new))[-limit:]
+            return merged, True
+        
+        shift = keep + len(new) - limit
+        if shift >= keep:
+            cached[:] = new[-limit:]
+            return cached, True
+        
+        if shift == 0 and np.array_equal(cached[keep:], new):
+            return cached, False
+        
+        cached[:keep - shift] = cached[shift:keep]
+        cached[keep - shift:] = new
+        return cached, True
+    
     def get_current_price(self, symbol: str) -> Optional[float]:
         """
         Get current market price for a symbol
@@ -102,90 +422,234 @@ class DataFetcher:
         Returns:
             Current price or None if error
         """
-        try:
-            ticker = self.exchange.fetch_ticker(symbol)
-            return float(ticker['last'])
-        except Exception as e:
-            self.logger.error(f"Error fetching price for {symbol}: {e}")
-            return None
+        return self.get_current_prices([symbol]).get(symbol)
     
-    def fetch_multiple_symbols(self, symbols: List[str], timeframe: str = '1h',
-                               limit: int = 100) -> Dict[str, pd.DataFrame]:
+    def get_current_prices(self, symbols: List[str]) -> Dict[str, float]:
         """
-        Fetch OHLCV data for multiple symbols
+        Get current market prices for several symbols
+        
+        Prices younger than price_ttl are served from memory; the rest are
+        requested together with a single fetch_tickers call when the
+        exchange supports it, otherwise one fetch_ticker per symbol.
         
         Args:
             symbols: List of trading pairs
-            timeframe: Candle timeframe
-            limit: Number of candles per symbol
             
         Returns:
-            Dictionary mapping symbols to DataFrames
+            Dictionary mapping symbols to prices (symbols that failed are omitted)
         """
-        data = {}
+        now = time.monotonic()
+        prices = {}
+        stale = []
         
         for symbol in symbols:
-            df = self.fetch_ohlcv(symbol, timeframe, limit)
-            if df is not None:
-                data[symbol] = df
-            
-            # Small delay to respect rate limits
-            time.sleep(0.2)
+            cached = self._price_cache.get(symbol)
+            if cached is not None and now - cached[1] < self.price_ttl:
+                prices[symbol] = cached[0]
+            else:
+                stale.append(symbol)
         
-        return data
+        if not stale:
+            return prices
+        
+        if len(stale) > 1 and self.exchange.has.get('fetchTickers'):
+            try:
+                tickers = self.exchange.fetch_tickers(stale)
+                fetched = {
+                    s: float(tickers[s]['last'])
+                    for s in stale
+                    if s in tickers and tickers[s].get('last') is not None
+                }
+            except Exception as e:
+                self.logger.error(f"Error fetching prices for {', '.join(stale)}: {e}")
+                fetched = {}
+        else:
+            fetched = {}
+            for symbol in stale:
+                try:
+                    ticker = self.exchange.fetch_ticker(symbol)
+                    fetched[symbol] = float(ticker['last'])
+                except Exception as e:
+                    self.logger.error(f"Error fetching price for {symbol}: {e}")
+        
+        now = time.monotonic()
+        for symbol, price in fetched.items():
+            self._price_cache[symbol] = (price, now)
+        
+        prices.update(fetched)
+        return prices
     
-    def get_numpy_arrays(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, 
-                                                           np.ndarray, np.ndarray]:
+    def fetch_multiple_symbols(self, symbols: List[str], timeframe: str = '1h',
+                               limit: int = 100) -> Dict[str, np.ndarray]:
         """
-        Convert DataFrame to numpy arrays for pattern detection
+        Fetch OHLCV data for multiple symbols
         
         Args:
-            df: OHLCV DataFrame
+            symbols: List of trading pairs
+            timeframe: Candle timeframe
+            limit: Number of candles per symbol
             
         Returns:
-            Tuple of (highs, lows, closes, volumes) as numpy arrays
+            Dictionary mapping symbols to OHLCV arrays
         """
-        highs = df['high'].to_numpy()
-        lows = df['low'].to_numpy()
-        closes = df['close'].to_numpy()
-        volumes = df['volume'].to_numpy()
+        data = {}
+        
+        for symbol in symbols:
+            # Pacing is handled by ccxt's throttle (enableRateLimit), which
+            # only waits before requests that actually hit the exchange
+            arr = self.fetch_ohlcv(symbol, timeframe, limit)
+            if arr is not None:
+                data[symbol] = arr
         
-        return highs, lows, closes, volumes
+        return data
     
-    def validate_data(self, df: pd.DataFrame) -> bool:
+    def validate_arr(self, arr: Optional[np.ndarray], min_bars: int = 1) -> bool:
         """
         Validate OHLCV data quality
         
         Args:
-            df: OHLCV DataFrame
+            arr: (N, 6) OHLCV array as returned by fetch_ohlcv
+            min_bars: Fewest bars worth analysing
             
         Returns:
             True if data is valid, False otherwise
         """
-        if df is None or df.empty:
+        if arr is None or arr.ndim != 2 or len(arr) < max(min_bars, 1):
             return False
         
-        # Check for required columns
-        required_cols = ['open', 'high', 'low', 'close', 'volume']
-        if not all(col in df.columns for col in required_cols):
+        if arr.shape[1] != len(OHLCV_COLUMNS):
             return False
         
-        # Check for NaN values
-        if df[required_cols].isnull().any().any():
-            self.logger.warning("Data contains NaN values")
-            return False
+        error = _validate_arr(arr[:, 1], arr[:, 2], arr[:, 3], arr[:, 4], arr[:, 5])
         
-        # Check for invalid prices (high >= low, etc.)
-        if not (df['high'] >= df['low']).all():
-            self.logger.warning("Invalid OHLC data: high < low")
+        if error:
+            self.logger.warning(_VALIDATION_ERRORS[error])
             return False
         
-        if not (df['high'] >= df['close']).all():
-            self.logger.warning("Invalid OHLC data: high < close")
-            return False
+        return True
+
+
+@lru_cache(maxsize=None)
+def get_fetcher(exchange_name: str = 'binance',
+                price_ttl: float = PRICE_CACHE_TTL,
+                load_markets: bool = True) -> DataFetcher:
+    """
+    Get the shared DataFetcher for an exchange
+    
+    Args:
+        exchange_name: Name of the exchange
+        price_ttl: Seconds a fetched ticker price is reused
+        load_markets: Load markets on creation (False defers to load_markets())
         
-        if not (df['low'] <= df['close']).all():
-            self.logger.warning("Invalid OHLC data: low > close")
-            return False
+    Returns:
+        DataFetcher instance reused by every caller in the process
+    """
+    return DataFetcher(exchange_name, price_ttl=price_ttl, load_markets=load_markets)
+
+
+class AsyncDataFetcher:
+    """Fetches market data concurrently using ccxt's asyncio support"""
+    
+    def __init__(self, exchange_name: str = 'binance'):
+        """
+        Initialize async data fetcher
         
-        return True
+        Args:
+            exchange_name: Name of the exchange (default: binance)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.exchange_name = exchange_name
+        
+        import ccxt.async_support as ccxt_async
+        
+        try:
+            exchange_class = getattr(ccxt_async, exchange_name)
+            self.exchange = exchange_class(_exchange_config(exchange_name))
+            self.logger.info(f"Connected to {exchange_name} exchange (async)")
+            
+        except Exception as e:
+            self.logger.error(f"Failed to initialize exchange: {e}")
+            raise
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    async def close(self):
+        """Release the underlying aiohttp session"""
+        await self.exchange.close()
+    
+    async def fetch_ohlcv(self, symbol: str, timeframe: str = '1h',
+                          limit: int = 100) -> Optional[np.ndarray]:
+        """
+        Fetch OHLCV data for a symbol
+        
+        Args:
+            symbol: Trading pair (e.g., 'BTC/USDT')
+            timeframe: Candle timeframe (e.g., '1m', '5m', '1h', '1d')
+            limit: Number of candles to fetch
+            
+        Returns:
+            (N, 6) float64 OHLCV array, or None if error
+        """
+        import ccxt
+        
+        try:
+            ohlcv = await self.exchange.fetch_ohlcv(
+                symbol=symbol,
+                timeframe=timeframe,
+                limit=limit
+            )
+            
+            if not ohlcv:
+                self.logger.warning(f"No data received for {symbol} {timeframe}")
+                return None
+            
+            arr = _ohlcv_to_array(ohlcv)
+            
+            self.logger.debug(f"Fetched {len(arr)} candles for {symbol} {timeframe}")
+            return arr
+            
+        except ccxt.NetworkError as e:
+            self.logger.error(f"Network error fetching {symbol}: {e}")
+            return None
+        except ccxt.ExchangeError as e:
+            self.logger.error(f"Exchange error fetching {symbol}: {e}")
+            return None
+        except Exception as e:
+            self.logger.error(f"Unexpected error fetching {symbol}: {e}")
+            return None
+    
+    async def fetch_multiple_symbols(self, symbols: List[str], timeframe: str = '1h',
+                                     limit: int = 100) -> Dict[str, np.ndarray]:
+        """
+        Fetch OHLCV data for multiple symbols concurrently
+        
+        Requests are issued together and paced by ccxt's built-in rate
+        limiter (enableRateLimit), so total latency approaches the slowest
+        single request rather than the sum of all of them.
+        
+        Args:
+            symbols: List of trading pairs
+            timeframe: Candle timeframe
+            limit: Number of candles per symbol
+            
+        Returns:
+            Dictionary mapping symbols to OHLCV arrays
+        """
+        tasks = [
+            asyncio.create_task(self.fetch_ohlcv(symbol, timeframe, limit))
+            for symbol in symbols
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        data = {}
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error fetching {symbol}: {result}")
+            elif result is not None:
+                data[symbol] = result
+        
+        return data
@@ -8,7 +8,7 @@ import sys
 from datetime import datetime
 
 from config import Config
-from data_fetcher import DataFetcher
+from data_fetcher import get_fetcher
 from pattern_detector import ReversalPatternDetector
 
 
@@ -33,7 +33,7 @@ async def demo_scan():
     print("="*70 + "\n")
     
     # Initialize components
-    data_fetcher = DataFetcher(Config.EXCHANGE)
+    data_fetcher = get_fetcher(Config.EXCHANGE)
     pattern_detector = ReversalPatternDetector(
         tolerance=Config.PATTERN_TOLERANCE,
         min_bars=Config.MIN_BARS
@@ -47,26 +47,24 @@ async def demo_scan():
         
         try:
             # Fetch data
-            df = data_fetcher.fetch_ohlcv(
+            ohlcv = data_fetcher.fetch_ohlcv(
                 symbol=symbol,
                 timeframe=timeframe,
                 limit=Config.LOOKBACK_PERIODS
             )
             
-            if df is None or not data_fetcher.validate_data(df):
+            if not data_fetcher.validate_arr(ohlcv, min_bars=Config.MIN_BARS):
                 logger.warning(f"Invalid data for {symbol} {timeframe}")
                 continue
             
-            # Get current price
-            current_price = data_fetcher.get_current_price(symbol)
-            if current_price is None:
-                current_price = df['close'].iloc[-1]
+            # Column views into the fetched array (no copies)
+            highs, lows, closes = ohlcv[:, 2], ohlcv[:, 3], ohlcv[:, 4]
             
-            print(f"💰 Current Price: ${current_price:,.2f}")
-            print(f"📈 Candles analyzed: {len(df)}")
+            # Latest close is the current price; avoids a ticker round-trip
+            current_price = float(closes[-1])
             
-            # Convert to numpy arrays
-            highs, lows, closes, volumes = data_fetcher.get_numpy_arrays(df)
+            print(f"💰 Current Price: ${current_price:,.2f}")
+            print(f"📈 Candles analyzed: {len(closes)}")
             
             # Detect patterns
             patterns = pattern_detector.detect_all_patterns(highs, lows, closes)
@@ -80,36 +78,32 @@ async def demo_scan():
             if high_confidence_patterns:
                 print(f"\n🎯 Found {len(high_confidence_patterns)} high-confidence pattern(s):\n")
                 
+                # Build the whole report first and write it in one call
+                lines = []
                 for i, pattern in enumerate(high_confidence_patterns, 1):
-                    # Determine signal type
-                    bullish_patterns = [
-                        "Inverse Head and Shoulders",
-                        "Double Bottom",
-                        "Triple Bottom",
-                        "Rounding Bottom",
-                        "Spike V (Bullish)"
-                    ]
-                    
-                    is_bullish = pattern.pattern_type in bullish_patterns
+                    is_bullish = pattern.is_bullish
                     signal_emoji = "🟢" if is_bullish else "🔴"
                     signal_type = "BULLISH" if is_bullish else "BEARISH"
                     
-                    print(f"{signal_emoji} Pattern #{i}: {pattern.pattern_type}")
-                    print(f"   Signal: {signal_type}")
-                    print(f"   Confidence: {pattern.confidence * 100:.1f}%")
-                    print(f"   Description: {pattern.description}")
+                    lines.append(f"{signal_emoji} Pattern #{i}: {pattern.pattern_type}")
+                    lines.append(f"   Signal: {signal_type}")
+                    lines.append(f"   Confidence: {pattern.confidence * 100:.1f}%")
+                    lines.append(f"   Description: {pattern.description}")
                     
                     # Show key levels
-                    print(f"   Key Levels:")
+                    lines.append("   Key Levels:")
                     for level_name, level_value in pattern.key_levels.items():
                         formatted_name = level_name.replace('_', ' ').title()
-                        print(f"     • {formatted_name}: ${level_value:,.2f}")
+                        lines.append(f"     • {formatted_name}: ${level_value:,.2f}")
                     
                     if is_bullish:
-                        print(f"   💡 Suggestion: Consider LONG position")
+                        lines.append("   💡 Suggestion: Consider LONG position")
                     else:
-                        print(f"   💡 Suggestion: Consider SHORT position")
-                    print()
+                        lines.append("   💡 Suggestion: Consider SHORT position")
+                    lines.append("")
+                
+                sys.stdout.write("\n".join(lines) + "\n")
+                sys.stdout.flush()
             else:
                 print(f"ℹ️  No high-confidence patterns detected")
                 
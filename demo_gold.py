@@ -4,40 +4,49 @@ Simulates GOLD price movements and sends alerts
 """
 import asyncio
 import numpy as np
+from numba_compat import njit
 from pattern_detector import ReversalPatternDetector
-from telegram_notifier import TelegramNotifier
+from telegram_notifier import get_notifier
 from config import Config
 
 
-def generate_gold_price_data(base_price=2650, length=100):
-    """Generate realistic GOLD price data with patterns"""
-    np.random.seed(42)
+@njit(cache=True, fastmath=True)
+def _build_gold_prices(base_price, noise, high_offsets, low_offsets):
+    """Compiled core of generate_gold_price_data (takes pre-drawn noise)"""
+    length = len(noise)
     
     # GOLD typically moves in smaller percentages than crypto
     trend = np.linspace(0, 50, length)
-    noise = np.random.normal(0, 5, length)
     prices = base_price + trend + noise
     
     # Add a double bottom pattern (bullish for GOLD)
     mid = length // 2
-    for i in range(mid - 10, mid + 10):
-        if i < mid - 5:  # First bottom
-            prices[i] -= (mid - 5 - i) * 2
-        elif i < mid:  # Rise to peak
-            prices[i] += (i - (mid - 5)) * 3
-        elif i < mid + 5:  # Second bottom
-            prices[i] -= (mid + 5 - i) * 2
-        else:  # Rise after double bottom
-            prices[i] += (i - (mid + 5)) * 3
+    step = np.arange(5) * 1.0
+    prices[mid - 10:mid + 10] += np.concatenate((
+        -(5 - step) * 2,    # First bottom
+        step * 3,           # Rise to peak
+        -(5 - step) * 2,    # Second bottom
+        step * 3,           # Rise after double bottom
+    ))
     
     # Generate OHLC
-    highs = prices + np.random.uniform(1, 5, length)
-    lows = prices - np.random.uniform(1, 5, length)
+    highs = prices + high_offsets
+    lows = prices - low_offsets
     closes = prices
     
     return highs, lows, closes
 
 
+def generate_gold_price_data(base_price=2650, length=100):
+    """Generate realistic GOLD price data with patterns"""
+    rng = np.random.default_rng(42)
+    noise = rng.normal(0, 5, length)
+    high_offsets = rng.uniform(1, 5, length)
+    low_offsets = rng.uniform(1, 5, length)
+    
+    return _build_gold_prices(float(base_price), noise, high_offsets, low_offsets)
+
+
 async def demo_gold_telegram():
     """Demo GOLD pattern detection with Telegram alerts"""
     print("\n" + "="*70)
@@ -48,7 +57,7 @@ async def demo_gold_telegram():
     
     # Initialize
     detector = ReversalPatternDetector(tolerance=0.015, min_bars=5)  # Tighter tolerance for GOLD
-    notifier = TelegramNotifier(
+    notifier = get_notifier(
         bot_token=Config.TELEGRAM_BOT_TOKEN,
         chat_id=Config.TELEGRAM_CHAT_ID
     )
@@ -67,7 +76,8 @@ async def demo_gold_telegram():
     symbols = ["XAU/USD", "XAU/EUR"]
     base_prices = [2650.00, 2450.00]  # Typical GOLD prices
     
-    total_alerts = 0
+    # Alerts from both pairs are sent together, paced at 1 msg/s per chat
+    pending = []
     
     for symbol, base_price in zip(symbols, base_prices):
         print(f"\n{'='*70}")
@@ -93,28 +103,33 @@ async def demo_gold_telegram():
         print(f"✓ {len(high_conf)} high-confidence patterns (≥70%)\n")
         
         if high_conf:
-            print(f"📤 Sending {len(high_conf)} alert(s) to Telegram for {symbol}...\n")
-            
-            for i, pattern in enumerate(high_conf, 1):
-                print(f"   Alert #{i}: {pattern.pattern_type} ({pattern.confidence*100:.1f}%)")
-                
-                success = await notifier.send_pattern_alert(
-                    pattern=pattern,
-                    symbol=f"{symbol} (GOLD)",
-                    timeframe="1h",
-                    current_price=current_price
-                )
-                
-                if success:
-                    print(f"   ✅ Sent to Telegram!")
-                    total_alerts += 1
-                else:
-                    print(f"   ❌ Failed to send")
-                
-                await asyncio.sleep(1)
+            pending.extend((symbol, pattern, current_price) for pattern in high_conf)
         else:
             print("ℹ️  No high-confidence patterns detected")
     
+    # The notifier's token bucket paces the sends
+    async def _send(symbol, pattern, current_price):
+        return await notifier.send_pattern_alert(
+            pattern=pattern,
+            symbol=f"{symbol} (GOLD)",
+            timeframe="1h",
+            current_price=current_price
+        )
+    
+    total_alerts = 0
+    
+    if pending:
+        print(f"\n📤 Sending {len(pending)} alert(s) to Telegram...\n")
+        results = await asyncio.gather(*(_send(*alert) for alert in pending))
+        
+        for i, ((symbol, pattern, _), success) in enumerate(zip(pending, results), 1):
+            print(f"   Alert #{i}: {pattern.pattern_type} on {symbol} ({pattern.confidence*100:.1f}%)")
+            if success:
+                print(f"   ✅ Sent to Telegram!")
+                total_alerts += 1
+            else:
+                print(f"   ❌ Failed to send")
+    
     print("\n" + "="*70)
     print("✅ GOLD Demo Completed!")
     print("="*70)
@@ -2,44 +2,56 @@
 Demo script with simulated data - Shows pattern detection in action
 No internet connection required
 """
+import sys
+
 import numpy as np
-from pattern_detector import ReversalPatternDetector
 
+from numba_compat import njit
 
-def generate_realistic_price_data(base_price=100000, length=100):
-    """Generate realistic price data with patterns"""
-    np.random.seed(42)
+
+@njit(cache=True, fastmath=True)
+def _build_realistic_prices(base_price, noise, high_offsets, low_offsets):
+    """Compiled core of generate_realistic_price_data (takes pre-drawn noise)"""
+    length = len(noise)
     
     # Create base trend
     trend = np.linspace(0, 10, length)
-    noise = np.random.normal(0, 500, length)
     prices = base_price + trend * 100 + noise
     
     # Add a head and shoulders pattern in the middle
     mid = length // 2
-    for i in range(mid - 15, mid + 15):
-        if i < mid - 10:  # Left shoulder
-            prices[i] += (i - (mid - 15)) * 200
-        elif i < mid - 5:  # Down to trough
-            prices[i] += (mid - 10 - i) * 200
-        elif i < mid:  # Up to head
-            prices[i] += (i - (mid - 5)) * 400
-        elif i < mid + 5:  # Down from head
-            prices[i] += (mid - i) * 400
-        elif i < mid + 10:  # Up to right shoulder
-            prices[i] += (i - (mid + 5)) * 200
-        else:  # Down from right shoulder
-            prices[i] += (mid + 15 - i) * 200
+    step = np.arange(5) * 1.0
+    prices[mid - 15:mid + 15] += np.concatenate((
+        step * 200,         # Left shoulder
+        -step * 200,        # Down to trough
+        step * 400,         # Up to head
+        -step * 400,        # Down from head
+        step * 200,         # Up to right shoulder
+        (5 - step) * 200,   # Down from right shoulder
+    ))
     
     # Generate OHLC from close prices
-    highs = prices + np.random.uniform(100, 500, length)
-    lows = prices - np.random.uniform(100, 500, length)
+    highs = prices + high_offsets
+    lows = prices - low_offsets
     closes = prices
     
     return highs, lows, closes
 
 
+def generate_realistic_price_data(base_price=100000, length=100):
+    """Generate realistic price data with patterns"""
+    rng = np.random.default_rng(42)
+    noise = rng.normal(0, 500, length)
+    high_offsets = rng.uniform(100, 500, length)
+    low_offsets = rng.uniform(100, 500, length)
+    
+    return _build_realistic_prices(float(base_price), noise, high_offsets, low_offsets)
+
+
 def main():
+    # Only needed for the CLI run, not for importing the generator
+    from pattern_detector import ReversalPatternDetector
+    
     print("\n" + "="*70)
     print("🚀 REVERSAL PATTERN DETECTION BOT - SIMULATION DEMO")
     print("="*70)
@@ -67,45 +79,41 @@ def main():
     if patterns:
         print(f"\n🎯 Found {len(patterns)} pattern(s):\n")
         
+        # Build the whole report first and write it in one call
+        lines = []
         for i, pattern in enumerate(patterns, 1):
-            # Determine signal type
-            bullish_patterns = [
-                "Inverse Head and Shoulders",
-                "Double Bottom",
-                "Triple Bottom",
-                "Rounding Bottom",
-                "Spike V (Bullish)"
-            ]
-            
-            is_bullish = pattern.pattern_type in bullish_patterns
+            is_bullish = pattern.is_bullish
             signal_emoji = "🟢" if is_bullish else "🔴"
             signal_type = "BULLISH" if is_bullish else "BEARISH"
             
-            print(f"{signal_emoji} Pattern #{i}: {pattern.pattern_type}")
-            print(f"   Signal: {signal_type}")
-            print(f"   Confidence: {pattern.confidence * 100:.1f}%")
-            print(f"   Candles: {pattern.start_idx} to {pattern.end_idx}")
-            print(f"   Description: {pattern.description}")
+            lines.append(f"{signal_emoji} Pattern #{i}: {pattern.pattern_type}")
+            lines.append(f"   Signal: {signal_type}")
+            lines.append(f"   Confidence: {pattern.confidence * 100:.1f}%")
+            lines.append(f"   Candles: {pattern.start_idx} to {pattern.end_idx}")
+            lines.append(f"   Description: {pattern.description}")
             
             # Show key levels
-            print(f"   Key Price Levels:")
+            lines.append("   Key Price Levels:")
             for level_name, level_value in pattern.key_levels.items():
                 formatted_name = level_name.replace('_', ' ').title()
-                print(f"     • {formatted_name}: ${level_value:,.2f}")
+                lines.append(f"     • {formatted_name}: ${level_value:,.2f}")
             
             # Trading suggestion
             if is_bullish:
-                print(f"   💡 Suggestion: Consider LONG position")
-                print(f"   🎯 Potential Entry: ${current_price:,.2f}")
+                lines.append("   💡 Suggestion: Consider LONG position")
+                lines.append(f"   🎯 Potential Entry: ${current_price:,.2f}")
                 if 'resistance' in pattern.key_levels:
-                    print(f"   🎯 Target: ${pattern.key_levels['resistance']:,.2f}")
+                    lines.append(f"   🎯 Target: ${pattern.key_levels['resistance']:,.2f}")
             else:
-                print(f"   💡 Suggestion: Consider SHORT position")
-                print(f"   🎯 Potential Entry: ${current_price:,.2f}")
+                lines.append("   💡 Suggestion: Consider SHORT position")
+                lines.append(f"   🎯 Potential Entry: ${current_price:,.2f}")
                 if 'support' in pattern.key_levels:
-                    print(f"   🎯 Target: ${pattern.key_levels['support']:,.2f}")
+                    lines.append(f"   🎯 Target: ${pattern.key_levels['support']:,.2f}")
             
-            print()
+            lines.append("")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
     else:
         print("ℹ️  No patterns detected in this dataset")
     
@@ -5,53 +5,35 @@ Uses simulated data to demonstrate notifications
 import asyncio
 import numpy as np
 from pattern_detector import ReversalPatternDetector, Pattern
-from telegram_notifier import TelegramNotifier
+from telegram_notifier import get_notifier
 from config import Config
 
 
 def generate_pattern_data():
     """Generate data with clear patterns"""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     
     # Create Head & Shoulders pattern
     base = 100000
-    prices = []
-    
-    # Uptrend to left shoulder
-    for i in range(10):
-        prices.append(base + i * 200 + np.random.uniform(-100, 100))
-    
-    # Left shoulder peak
-    for i in range(3):
-        prices.append(base + 2000 + np.random.uniform(-50, 50))
-    
-    # Down to trough
-    for i in range(5):
-        prices.append(base + 2000 - i * 300 + np.random.uniform(-100, 100))
-    
-    # Up to head
-    for i in range(7):
-        prices.append(base + 500 + i * 400 + np.random.uniform(-100, 100))
-    
-    # Down from head
-    for i in range(7):
-        prices.append(base + 3300 - i * 400 + np.random.uniform(-100, 100))
-    
-    # Up to right shoulder
-    for i in range(5):
-        prices.append(base + 500 + i * 300 + np.random.uniform(-100, 100))
-    
-    # Right shoulder peak
-    for i in range(3):
-        prices.append(base + 2000 + np.random.uniform(-50, 50))
-    
-    # Downtrend
-    for i in range(10):
-        prices.append(base + 2000 - i * 200 + np.random.uniform(-100, 100))
-    
-    prices = np.array(prices)
-    highs = prices + np.random.uniform(50, 200, len(prices))
-    lows = prices - np.random.uniform(50, 200, len(prices))
+    trend = np.concatenate((
+        base + np.arange(10) * 200,         # Uptrend to left shoulder
+        np.full(3, base + 2000),            # Left shoulder peak
+        base + 2000 - np.arange(5) * 300,   # Down to trough
+        base + 500 + np.arange(7) * 400,    # Up to head
+        base + 3300 - np.arange(7) * 400,   # Down from head
+        base + 500 + np.arange(5) * 300,    # Up to right shoulder
+        np.full(3, base + 2000),            # Right shoulder peak
+        base + 2000 - np.arange(10) * 200,  # Downtrend
+    ))
+    
+    # Shoulder peaks are flatter than the legs around them
+    noise_scale = np.full(len(trend), 100.0)
+    noise_scale[10:13] = 50
+    noise_scale[37:40] = 50
+    
+    prices = trend + rng.uniform(-1, 1, len(trend)) * noise_scale
+    highs = prices + rng.uniform(50, 200, len(prices))
+    lows = prices - rng.uniform(50, 200, len(prices))
     closes = prices
     
     return highs, lows, closes
@@ -67,7 +49,7 @@ async def demo_with_telegram():
     
     # Initialize
     detector = ReversalPatternDetector(tolerance=0.03, min_bars=5)
-    notifier = TelegramNotifier(
+    notifier = get_notifier(
         bot_token=Config.TELEGRAM_BOT_TOKEN,
         chat_id=Config.TELEGRAM_CHAT_ID
     )
@@ -103,23 +85,24 @@ async def demo_with_telegram():
     if high_conf_patterns:
         print(f"📤 Sending {len(high_conf_patterns)} alert(s) to Telegram...\n")
         
-        for i, pattern in enumerate(high_conf_patterns, 1):
-            print(f"   Sending alert #{i}: {pattern.pattern_type} ({pattern.confidence*100:.1f}%)")
-            
-            success = await notifier.send_pattern_alert(
+        # The notifier's token bucket paces the sends
+        async def _send(pattern):
+            return await notifier.send_pattern_alert(
                 pattern=pattern,
                 symbol="BTC/USDT (DEMO)",
                 timeframe="1h",
                 current_price=current_price
             )
+        
+        results = await asyncio.gather(*(_send(p) for p in high_conf_patterns))
+        
+        for i, (pattern, success) in enumerate(zip(high_conf_patterns, results), 1):
+            print(f"   Alert #{i}: {pattern.pattern_type} ({pattern.confidence*100:.1f}%)")
             
             if success:
                 print(f"   ✅ Alert sent successfully!")
             else:
                 print(f"   ❌ Failed to send alert")
-            
-            # Small delay between messages
-            await asyncio.sleep(1)
     else:
         print("ℹ️  No high-confidence patterns to send")
     
@@ -17,6 +17,13 @@ sudo apt-get upgrade -y
 echo "🐍 Installing Python 3 and pip..."
 sudo apt-get install -y python3 python3-pip python3-venv git
 
+# Check the Python version (numpy/pandas/numba need Python 3.9+)
+if ! python3 -c 'import sys; sys.exit(sys.version_info < (3, 9))'; then
+    echo "❌ Python 3.9 or newer is required (found $(python3 --version 2>&1))."
+    echo "   Install a newer python3 (e.g. Ubuntu 22.04+) and run this script again."
+    exit 1
+fi
+
 # Clone repository (if not already cloned)
 if [ ! -d "reversal_bot" ]; then
     echo "📥 Cloning repository..."
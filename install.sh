@@ -8,6 +8,13 @@ echo "║     GOLD/USD Reversal Bot - Installation Script             ║"
 echo "╚══════════════════════════════════════════════════════════════╝"
 echo ""
 
+# Check the Python version (numpy/pandas/numba need Python 3.9+)
+if ! python3 -c 'import sys; sys.exit(sys.version_info < (3, 9))'; then
+    echo "❌ Python 3.9 or newer is required (found $(python3 --version 2>&1))."
+    echo "   Install a newer python3 (e.g. Ubuntu 22.04+) and run this script again."
+    exit 1
+fi
+
 # Create virtual environment
 echo "📦 Creating virtual environment..."
 python3 -m venv venv
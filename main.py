@@ -4,14 +4,64 @@ Main application that monitors markets and sends Telegram alerts
 """
 import asyncio
 import logging
+import queue
+import random
+import signal
 import sys
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Set, Tuple
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+try:
+    import uvloop
+except ImportError:  # optional speedup, falls back to the default asyncio loop
+    uvloop = None
 
 from config import Config
-from data_fetcher import DataFetcher
-from pattern_detector import ReversalPatternDetector
-from telegram_notifier import TelegramNotifier
+from data_fetcher import CACHE_DIR, get_fetcher
+from notification_store import NotificationStore
+from pattern_detector import PATTERN_TYPES, PatternBatch, PatternStream, ReversalPatternDetector
+from telegram_notifier import PatternAlert, get_notifier
+
+
+# Upper bound on remembered alerts (oldest are evicted first)
+MAX_NOTIFIED = 10_000
+
+# Shortest time an alert suppresses repeats of the same pattern (seconds).
+# Each timeframe keeps its alerts until the anchor bar has left the fetched
+# window (LOOKBACK_PERIODS bars plus NOTIFIED_SLACK_BARS), as until then a
+# closed-candle scan can find the same pattern again
+NOTIFIED_TTL = 3600
+NOTIFIED_SLACK_BARS = 2
+
+# Scans per timeframe between purges of expired alerts from the store
+NOTIFIED_PRUNE_EVERY = 10
+
+# Error alerts waiting to be sent, and how long an identical one is suppressed (seconds)
+ERROR_QUEUE_SIZE = 100
+ERROR_DEDUP_WINDOW = 60
+
+# Alerts collected during a scan before they are sent as one batch
+ALERT_FLUSH_SIZE = 10
+
+# Detection results remembered per (symbol, timeframe, last closed bar)
+PATTERN_CACHE_SIZE = 512
+
+# Log file rotation: size of each file (bytes) and number of backups kept
+LOG_MAX_BYTES = 10_000_000
+LOG_BACKUP_COUNT = 5
+
+# Seconds to wait after a candle closes before scanning it, plus up to
+# CANDLE_CLOSE_JITTER more so timeframes closing together don't burst
+CANDLE_CLOSE_DELAY = 2.0
+CANDLE_CLOSE_JITTER = 3.0
+
+# (symbol, timeframe, pattern type, anchor bar timestamp)
+PatternId = Tuple[str, str, str, int]
 
 
 class ReversalBot:
@@ -25,36 +75,92 @@ class ReversalBot:
         # Validate configuration
         if not Config.validate():
             self.logger.error("Invalid configuration. Please check your .env file")
+            # Flush the queued error to the console/file before exiting
+            self._log_listener.stop()
             sys.exit(1)
         
         Config.display()
         
         # Initialize components
-        self.data_fetcher = DataFetcher(Config.EXCHANGE)
+        # Markets are loaded later in _startup, overlapped with the Telegram check
+        self.data_fetcher = get_fetcher(
+            Config.EXCHANGE, price_ttl=Config.PRICE_CACHE_TTL, load_markets=False
+        )
+        self.data_fetcher.preallocate(
+            Config.SYMBOLS, Config.TIMEFRAMES, Config.LOOKBACK_PERIODS
+        )
         self.pattern_detector = ReversalPatternDetector(
             tolerance=Config.PATTERN_TOLERANCE,
-            min_bars=Config.MIN_BARS
+            min_bars=Config.MIN_BARS,
+            workers=Config.DETECTION_WORKERS,
+            tick_size=Config.TICK_SIZE or None
         )
-        self.telegram_notifier = TelegramNotifier(
+        self.telegram_notifier = get_notifier(
             bot_token=Config.TELEGRAM_BOT_TOKEN,
-            chat_id=Config.TELEGRAM_CHAT_ID
+            chat_id=Config.TELEGRAM_CHAT_ID,
+            plain_text=Config.TELEGRAM_PLAIN_TEXT
         )
         
-        # Track already notified patterns to avoid duplicates
-        self.notified_patterns: Set[Tuple[str, str, str]] = set()
+        # Set by SIGINT/SIGTERM (or stop()) to end the scan loops cleanly
+        self._stop = asyncio.Event()
+        
+        # Error alerts are sent by a background task so scans never wait on Telegram
+        self._err_q: asyncio.Queue = asyncio.Queue(maxsize=ERROR_QUEUE_SIZE)
+        
+        # Detection results keyed by (symbol, timeframe, last closed bar ts, bars)
+        self._pattern_cache: OrderedDict[Tuple[str, str, int, int], PatternBatch] = OrderedDict()
+        
+        # Per symbol/timeframe detection state, so a new bar only re-scans the tail
+        self._pattern_streams: Dict[Tuple[str, str], PatternStream] = {}
+        
+        # Threshold as a NumPy scalar for the vectorised confidence filter
+        self._min_confidence = np.float64(Config.MIN_CONFIDENCE)
+        
+        # Caps how many symbol/timeframe scans hit the exchange at once
+        self._scan_sem = asyncio.Semaphore(Config.MAX_CONCURRENT_SCANS)
+        
+        # Track already notified patterns to avoid duplicates, keyed by
+        # (symbol, timeframe, pattern type, anchor bar timestamp); sent alerts
+        # are persisted so a restart doesn't re-send them
+        self.notified_patterns: OrderedDict[PatternId, float] = OrderedDict()
+        self._notified_ttls = {
+            timeframe: max(NOTIFIED_TTL, (Config.LOOKBACK_PERIODS + NOTIFIED_SLACK_BARS)
+                           * self.data_fetcher.exchange.parse_timeframe(timeframe))
+            for timeframe in Config.TIMEFRAMES
+        }
+        self._notified_store = NotificationStore(CACHE_DIR / 'notified.db')
+        now = time.time()
+        self._notified_store.prune(now - max(self._notified_ttls.values()))
+        for timeframe, ttl in self._notified_ttls.items():
+            self._notified_store.prune(now - ttl, timeframe)
+        self.notified_patterns.update(
+            (pattern_id, sent_at)
+            for pattern_id, sent_at in self._notified_store.load(now - max(self._notified_ttls.values()))
+            if now - sent_at <= self._notified_ttl(pattern_id[1])
+        )
         
         self.logger.info("Reversal Bot initialized successfully")
     
     def _setup_logging(self):
         """Setup logging configuration"""
+        # Records are formatted by the QueueHandler and written by a
+        # background thread, so console/file I/O never blocks the event loop
+        log_queue = queue.Queue(-1)
         logging.basicConfig(
             level=getattr(logging, Config.LOG_LEVEL),
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.StreamHandler(sys.stdout),
-                logging.FileHandler('reversal_bot.log')
-            ]
+            handlers=[QueueHandler(log_queue)]
         )
+        self._log_listener = QueueListener(
+            log_queue,
+            logging.StreamHandler(sys.stdout),
+            RotatingFileHandler(
+                'reversal_bot.log',
+                maxBytes=LOG_MAX_BYTES,
+                backupCount=LOG_BACKUP_COUNT
+            )
+        )
+        self._log_listener.start()
         self.logger = logging.getLogger(__name__)
     
     async def test_connection(self) -> bool:
@@ -74,131 +180,385 @@ class ReversalBot:
         
         return success
     
-    async def scan_symbol(self, symbol: str, timeframe: str):
+    async def scan_symbol(self, symbol: str,
+                          timeframe: str) -> List[Tuple[PatternId, PatternAlert]]:
         """
         Scan a single symbol for reversal patterns
         
         Args:
             symbol: Trading pair to scan
             timeframe: Timeframe to analyze
+            
+        Returns:
+            New high-confidence alerts (with their ids) to send this scan
         """
+        alerts = []
+        lookback = Config.LOOKBACK_PERIODS
+        min_bars = Config.MIN_BARS
+        
         try:
-            # Fetch market data
-            df = self.data_fetcher.fetch_ohlcv(
-                symbol=symbol,
-                timeframe=timeframe,
-                limit=Config.LOOKBACK_PERIODS
+            # Fetch market data (ccxt is blocking, so keep it off the event loop)
+            ohlcv = await asyncio.to_thread(
+                self.data_fetcher.fetch_ohlcv,
+                symbol,
+                timeframe,
+                lookback
             )
             
-            if df is None or not self.data_fetcher.validate_data(df):
+            if not self.data_fetcher.validate_arr(ohlcv, min_bars=min_bars):
                 self.logger.warning(f"Invalid data for {symbol} {timeframe}")
-                return
-            
-            # Convert to numpy arrays
-            highs, lows, closes, volumes = self.data_fetcher.get_numpy_arrays(df)
+                return alerts
             
             # Detect patterns
-            patterns = self.pattern_detector.detect_all_patterns(highs, lows, closes)
+            batch = await self._detect_patterns(symbol, timeframe, ohlcv)
+            
+            # Filter by confidence threshold (one compare over the column)
+            idxs = np.flatnonzero(batch.confidence >= self._min_confidence)
             
-            # Filter by confidence threshold
-            high_confidence_patterns = [
-                p for p in patterns 
-                if p.confidence >= Config.MIN_CONFIDENCE
+            if len(idxs) == 0:
+                # Skip building the message unless DEBUG is actually enabled
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"No high-confidence patterns found for {symbol} {timeframe}")
+                return alerts
+            
+            # Identify each pattern by the bar it completes on, so it is
+            # reported once but a new occurrence is reported again
+            anchor_ts = ohlcv[np.minimum(batch.end_idx[idxs], len(ohlcv) - 1), 0].astype(np.int64)
+            pattern_ids = [
+                (symbol, timeframe, PATTERN_TYPES[code], int(ts))
+                for code, ts in zip(batch.pattern_type[idxs], anchor_ts)
             ]
             
-            if not high_confidence_patterns:
-                self.logger.debug(f"No high-confidence patterns found for {symbol} {timeframe}")
-                return
+            # One set difference against everything already notified
+            new_ids = self._new_pattern_ids(pattern_ids)
+            if not new_ids:
+                return alerts
             
             # Get current price
-            current_price = self.data_fetcher.get_current_price(symbol)
+            current_price = await asyncio.to_thread(
+                self.data_fetcher.get_current_price, symbol
+            )
             if current_price is None:
-                current_price = closes[-1]
+                current_price = float(ohlcv[-1, 4])
             
-            # Send notifications for new patterns
-            for pattern in high_confidence_patterns:
-                # Create unique identifier for this pattern
-                pattern_id = (symbol, timeframe, pattern.pattern_type)
-                
-                # Skip if already notified
-                if pattern_id in self.notified_patterns:
+            # Queue notifications for new patterns (first occurrence of each id)
+            for idx, pattern_id in zip(idxs, pattern_ids):
+                if pattern_id not in new_ids:
                     continue
                 
-                # Send Telegram alert
-                success = await self.telegram_notifier.send_pattern_alert(
-                    pattern=pattern,
+                new_ids.discard(pattern_id)
+                alerts.append((pattern_id, PatternAlert(
+                    pattern=batch[idx],
                     symbol=symbol,
                     timeframe=timeframe,
                     current_price=current_price
-                )
-                
-                if success:
-                    self.notified_patterns.add(pattern_id)
-                    self.logger.info(
-                        f"✓ Alert sent: {pattern.pattern_type} on {symbol} {timeframe} "
-                        f"(Confidence: {pattern.confidence*100:.1f}%)"
-                    )
-                
-                # Small delay between notifications
-                await asyncio.sleep(1)
+                )))
         
         except Exception as e:
             self.logger.error(f"Error scanning {symbol} {timeframe}: {e}")
-            await self.telegram_notifier.send_error_alert(
-                f"Error scanning {symbol} {timeframe}: {str(e)}"
-            )
+            self._report_error(f"Error scanning {symbol} {timeframe}: {str(e)}")
+        
+        return alerts
+    
+    async def _detect_patterns(self, symbol: str, timeframe: str,
+                               ohlcv: np.ndarray) -> PatternBatch:
+        """
+        Detect patterns, reusing the result while the newest bar is still open
+        
+        Between two scans inside one candle only the unfinished last bar
+        moves, so results are keyed on the last closed bar's timestamp.
+        Once a new bar closes, the symbol's PatternStream re-scans only the
+        tail of the window. With a detector thread pool the detection
+        waits on its threads, so it runs off the event loop.
+        
+        Args:
+            symbol: Trading pair
+            timeframe: Candle timeframe
+            ohlcv: (N, 6) OHLCV array
+            
+        Returns:
+            PatternBatch of detected patterns
+        """
+        key = (symbol, timeframe, int(ohlcv[-2, 0]) if len(ohlcv) > 1 else 0, len(ohlcv))
+        
+        batch = self._pattern_cache.get(key)
+        if batch is not None:
+            self._pattern_cache.move_to_end(key)
+            return batch
+        
+        stream = self._pattern_streams.get((symbol, timeframe))
+        if stream is None:
+            stream = self._pattern_streams[(symbol, timeframe)] = PatternStream(self.pattern_detector)
+        
+        # Column views into the fetched array (no copies)
+        columns = (ohlcv[:, 0], ohlcv[:, 2], ohlcv[:, 3], ohlcv[:, 4])
+        if self.pattern_detector.parallel:
+            batch = await asyncio.to_thread(stream.update, *columns)
+        else:
+            batch = stream.update(*columns)
+        
+        self._pattern_cache[key] = batch
+        if len(self._pattern_cache) > PATTERN_CACHE_SIZE:
+            self._pattern_cache.popitem(last=False)
+        
+        return batch
+    
+    def _report_error(self, message: str):
+        """Queue an error alert without waiting, dropping the oldest if full"""
+        if self._err_q.full():
+            dropped = self._err_q.get_nowait()
+            self.logger.warning(f"Error alert queue full, dropped: {dropped}")
+        self._err_q.put_nowait(message)
     
-    async def scan_all_markets(self):
-        """Scan all configured symbols and timeframes"""
-        self.logger.info("Starting market scan...")
+    async def _error_drain(self):
+        """Send queued error alerts, skipping repeats within ERROR_DEDUP_WINDOW"""
+        last_sent = {}
+        
+        while True:
+            message = await self._err_q.get()
+            now = time.monotonic()
+            
+            # Forget messages whose suppression window has passed
+            last_sent = {m: t for m, t in last_sent.items() if now - t < ERROR_DEDUP_WINDOW}
+            
+            if message not in last_sent:
+                last_sent[message] = now
+                await self.telegram_notifier.send_error_alert(message)
+    
+    def _new_pattern_ids(self, pattern_ids: List[PatternId]) -> Set[PatternId]:
+        """
+        Find which patterns have not been notified recently
+        
+        Expired entries are dropped from the front of the LRU first; ids
+        that are still remembered are refreshed so a pattern that persists
+        is not re-sent.
+        
+        Args:
+            pattern_ids: (symbol, timeframe, pattern type, anchor bar timestamp) ids
+            
+        Returns:
+            Set of ids not notified within their timeframe's TTL
+        """
+        now = time.time()
+        notified = self.notified_patterns
+        
+        while notified:
+            pattern_id, sent_at = next(iter(notified.items()))
+            if now - sent_at <= self._notified_ttl(pattern_id[1]):
+                break
+            notified.popitem(last=False)
+        
+        # Timeframes expire at different ages, so an expired id may still sit
+        # behind an unexpired one of a longer timeframe
+        candidate_ids = set(pattern_ids)
+        new_ids = {
+            pattern_id for pattern_id in candidate_ids
+            if pattern_id not in notified
+            or now - notified[pattern_id] > self._notified_ttl(pattern_id[1])
+        }
+        
+        for pattern_id in candidate_ids - new_ids:
+            self.notified_patterns[pattern_id] = now
+            self.notified_patterns.move_to_end(pattern_id)
+        
+        return new_ids
+    
+    def _notified_ttl(self, timeframe: str) -> float:
+        """Seconds an alert on a timeframe suppresses the same pattern"""
+        return self._notified_ttls.get(timeframe, NOTIFIED_TTL)
+    
+    def _mark_notified(self, pattern_ids: List[PatternId]):
+        """Remember sent alerts, evicting the least recent beyond MAX_NOTIFIED"""
+        now = time.time()
+        for pattern_id in pattern_ids:
+            self.notified_patterns[pattern_id] = now
+            self.notified_patterns.move_to_end(pattern_id)
+        
+        while len(self.notified_patterns) > MAX_NOTIFIED:
+            self.notified_patterns.popitem(last=False)
+        
+        self._notified_store.save([(pattern_id, now) for pattern_id in pattern_ids])
+    
+    async def _scan_symbol_bounded(self, symbol: str,
+                                   timeframe: str) -> List[Tuple[PatternId, PatternAlert]]:
+        """Run scan_symbol once a concurrency slot is free"""
+        async with self._scan_sem:
+            return await self.scan_symbol(symbol, timeframe)
+    
+    async def scan_all_markets(self, timeframes: Optional[Sequence[str]] = None):
+        """
+        Scan all configured symbols on the given timeframes
+        
+        Args:
+            timeframes: Timeframes to scan (default: all configured timeframes)
+        """
+        symbols = Config.SYMBOLS
+        if timeframes is None:
+            timeframes = Config.TIMEFRAMES
+        
+        self.logger.info(f"Starting market scan ({', '.join(timeframes)})...")
+        
+        # Fetch every symbol's price in one request; the per-timeframe
+        # scans below then read it from the fetcher's price cache
+        await asyncio.to_thread(self.data_fetcher.get_current_prices, list(symbols))
         
         tasks = []
-        for symbol in Config.SYMBOLS:
-            for timeframe in Config.TIMEFRAMES:
-                task = self.scan_symbol(symbol, timeframe)
+        for symbol in symbols:
+            for timeframe in timeframes:
+                task = self._scan_symbol_bounded(symbol, timeframe)
                 tasks.append(task)
         
-        # Run all scans concurrently
-        await asyncio.gather(*tasks, return_exceptions=True)
+        # Run all scans concurrently (at most MAX_CONCURRENT_SCANS in flight)
+        # and send alerts as results arrive instead of after the slowest scan
+        pending = []
+        for future in asyncio.as_completed(tasks):
+            try:
+                pending.extend(await future)
+            except Exception as e:
+                self.logger.error(f"Scan task failed: {e}")
+                continue
+            
+            if len(pending) >= ALERT_FLUSH_SIZE:
+                await self._send_alerts(pending)
+                pending = []
+        
+        await self._send_alerts(pending)
         
-        self.logger.info("Market scan completed")
+        self.logger.info(f"Market scan completed ({', '.join(timeframes)})")
     
-    async def run(self):
-        """Main bot loop"""
-        self.logger.info("Starting Reversal Bot...")
+    async def _send_alerts(self, pending: List[Tuple[PatternId, PatternAlert]]):
+        """
+        Send alerts in as few messages as possible and remember the delivered ones
         
-        # Test Telegram connection
-        if not await self.test_connection():
-            self.logger.error("Failed to connect to Telegram. Exiting...")
+        Args:
+            pending: (id, alert) pairs returned by scan_symbol
+        """
+        if not pending:
             return
         
-        # Main monitoring loop
+        delivered = set(await self.telegram_notifier.send_batch(
+            [alert for _, alert in pending]
+        ))
+        
+        sent_ids = []
+        for pattern_id, alert in pending:
+            if alert not in delivered:
+                continue
+            
+            sent_ids.append(pattern_id)
+            self.logger.info(
+                f"✓ Alert sent: {alert.pattern.pattern_type} on {alert.symbol} {alert.timeframe} "
+                f"(Confidence: {alert.pattern.confidence*100:.1f}%)"
+            )
+        
+        self._mark_notified(sent_ids)
+    
+    def _seconds_until_close(self, timeframe: str) -> float:
+        """
+        Time until the current candle of a timeframe closes
+        
+        Args:
+            timeframe: Candle timeframe (e.g., '15m', '4h')
+            
+        Returns:
+            Seconds until the next multiple of the timeframe since the epoch
+        """
+        tf_seconds = self.data_fetcher.exchange.parse_timeframe(timeframe)
+        return tf_seconds - (time.time() % tf_seconds)
+    
+    async def _scan_loop(self, timeframe: str):
+        """
+        Scan one timeframe now, then again shortly after each candle close
+        
+        Args:
+            timeframe: Timeframe whose symbols this loop scans
+        """
         scan_count = 0
-        try:
-            while True:
-                scan_count += 1
-                self.logger.info(f"\n{'='*60}")
-                self.logger.info(f"Scan #{scan_count} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-                self.logger.info(f"{'='*60}")
-                
-                # Scan all markets
-                await self.scan_all_markets()
-                
-                # Clear old notifications periodically (every 10 scans)
-                if scan_count % 10 == 0:
-                    self.logger.info("Clearing notification cache...")
-                    self.notified_patterns.clear()
-                
-                # Wait before next scan
-                self.logger.info(f"Waiting {Config.SCAN_INTERVAL} seconds until next scan...")
-                await asyncio.sleep(Config.SCAN_INTERVAL)
+        while not self._stop.is_set():
+            scan_count += 1
+            self.logger.info(f"Scan #{scan_count} [{timeframe}] - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            
+            await self.scan_all_markets([timeframe])
+            
+            if scan_count % NOTIFIED_PRUNE_EVERY == 0:
+                self._notified_store.prune(time.time() - self._notified_ttl(timeframe), timeframe)
+            
+            # Nothing changes in a closed-candle scan until the next close
+            delay = (self._seconds_until_close(timeframe) + CANDLE_CLOSE_DELAY
+                     + random.uniform(0, CANDLE_CLOSE_JITTER))
+            self.logger.info(f"Next {timeframe} scan in {delay:.0f} seconds")
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+    
+    async def _startup(self) -> bool:
+        """
+        Load exchange markets and test Telegram at the same time
         
-        except KeyboardInterrupt:
-            self.logger.info("\nBot stopped by user")
-        except Exception as e:
-            self.logger.error(f"Fatal error: {e}")
-            await self.telegram_notifier.send_error_alert(f"Fatal error: {str(e)}")
-            raise
+        Returns:
+            True if the Telegram connection works, False otherwise
+        """
+        _, connected = await asyncio.gather(
+            asyncio.to_thread(self.data_fetcher.load_markets),
+            self.test_connection()
+        )
+        return connected
+    
+    def stop(self):
+        """Ask the scan loops to exit once their in-flight scan finishes"""
+        if not self._stop.is_set():
+            self.logger.info("Stopping Reversal Bot...")
+            self._stop.set()
+    
+    async def run(self):
+        """Main bot loop"""
+        self.logger.info("Starting Reversal Bot...")
+        
+        try:
+            await self._monitor()
+        finally:
+            self._notified_store.close()
+            self.pattern_detector.close()
+            
+            # Flush queued log records and stop the writer thread
+            self._log_listener.stop()
+    
+    async def _monitor(self):
+        """Test the Telegram connection, then scan until stopped"""
+        # One Telegram HTTP client (and connection pool) for the whole run
+        async with self.telegram_notifier:
+            # Test Telegram connection
+            if not await self._startup():
+                self.logger.error("Failed to connect to Telegram. Exiting...")
+                return
+            
+            # Let SIGINT/SIGTERM finish in-flight scans instead of killing them
+            loop = asyncio.get_running_loop()
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                try:
+                    loop.add_signal_handler(sig, self.stop)
+                except (NotImplementedError, RuntimeError):
+                    # No loop signal handlers on this platform (e.g. Windows)
+                    pass
+            
+            error_task = asyncio.create_task(self._error_drain())
+            
+            # Main monitoring loop: each timeframe wakes on its own candle closes
+            try:
+                await asyncio.gather(*(
+                    self._scan_loop(timeframe) for timeframe in Config.TIMEFRAMES
+                ))
+                self.logger.info("Bot stopped")
+            
+            except KeyboardInterrupt:
+                self.logger.info("\nBot stopped by user")
+            except Exception as e:
+                self.logger.error(f"Fatal error: {e}")
+                await self.telegram_notifier.send_error_alert(f"Fatal error: {str(e)}")
+                raise
+            finally:
+                error_task.cancel()
 
 
 async def main():
@@ -207,6 +567,34 @@ async def main():
     await bot.run()
 
 
+def _io_uring_policy() -> Optional[asyncio.AbstractEventLoopPolicy]:
+    """
+    Get uringcore's io_uring event loop policy if it works on this host
+    
+    io_uring needs Linux 5.11+ and is often blocked (e.g. by Docker's default
+    seccomp profile), so a loop is created once as a probe.
+    
+    Returns:
+        The policy, or None when uringcore is missing or io_uring is unusable
+    """
+    try:
+        import uringcore
+        policy = uringcore.EventLoopPolicy()
+        policy.new_event_loop().close()
+    except Exception as e:
+        print(f"io_uring event loop unavailable ({e}), falling back")
+        return None
+    return policy
+
+
 if __name__ == "__main__":
-    # Run the bot
-    asyncio.run(main())
+    # Run the bot on libuv's event loop when uvloop is installed, or on
+    # io_uring completions (uringcore) when opted in with USE_IO_URING
+    policy = _io_uring_policy() if Config.USE_IO_URING else None
+    if policy is not None:
+        asyncio.set_event_loop_policy(policy)
+        asyncio.run(main())
+    elif uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
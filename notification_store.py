@@ -0,0 +1,96 @@
+"""
+Notification Store Module
+Persists sent-alert ids so a restart doesn't re-send recent alerts
+"""
+import logging
+import sqlite3
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+
+# (symbol, timeframe, pattern type, anchor bar timestamp)
+AlertId = Tuple[str, str, str, int]
+
+
+class NotificationStore:
+    """SQLite-backed record of sent alerts and when they were sent"""
+    
+    def __init__(self, path: Path):
+        """
+        Open (or create) the store
+        
+        Args:
+            path: SQLite database file
+        """
+        self.logger = logging.getLogger(__name__)
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Autocommit; WAL with synchronous=NORMAL keeps each insert cheap
+        self.conn = sqlite3.connect(path, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS notified ("
+            " symbol TEXT NOT NULL,"
+            " timeframe TEXT NOT NULL,"
+            " pattern_type TEXT NOT NULL,"
+            " anchor_ts INTEGER NOT NULL,"
+            " sent_at REAL NOT NULL,"
+            " PRIMARY KEY (symbol, timeframe, pattern_type, anchor_ts))"
+        )
+    
+    def load(self, since: float) -> List[Tuple[AlertId, float]]:
+        """
+        Get alerts sent after a point in time, oldest first
+        
+        Args:
+            since: Unix time; older alerts are skipped
+            
+        Returns:
+            List of (alert id, sent_at) pairs
+        """
+        rows = self.conn.execute(
+            "SELECT symbol, timeframe, pattern_type, anchor_ts, sent_at"
+            " FROM notified WHERE sent_at > ? ORDER BY sent_at",
+            (since,)
+        )
+        return [((s, tf, p, ts), sent_at) for s, tf, p, ts, sent_at in rows]
+    
+    def save(self, entries: List[Tuple[AlertId, float]]):
+        """
+        Record sent alerts (replacing earlier records of the same ids)
+        
+        Args:
+            entries: List of (alert id, sent_at) pairs
+        """
+        try:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO notified VALUES (?, ?, ?, ?, ?)",
+                [(*alert_id, sent_at) for alert_id, sent_at in entries]
+            )
+        except sqlite3.Error as e:
+            self.logger.warning(f"Failed to persist sent alerts: {e}")
+    
+    def prune(self, before: float, timeframe: Optional[str] = None):
+        """
+        Delete alerts sent before a point in time
+        
+        Args:
+            before: Unix time
+            timeframe: Only delete alerts on this timeframe (default: all)
+        """
+        try:
+            if timeframe is None:
+                self.conn.execute("DELETE FROM notified WHERE sent_at < ?", (before,))
+            else:
+                self.conn.execute(
+                    "DELETE FROM notified WHERE sent_at < ? AND timeframe = ?",
+                    (before, timeframe)
+                )
+        except sqlite3.Error as e:
+            self.logger.warning(f"Failed to prune sent alerts: {e}")
+    
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
@@ -0,0 +1,15 @@
+"""
+Numba Compatibility Module
+Exposes numba's JIT decorators, falling back to plain Python when numba is not installed
+"""
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -2,9 +2,644 @@
 Reversal Pattern Detection Module
 Detects major reversal patterns in price data
 """
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Iterator, List, Dict, Optional, Tuple
+from dataclasses import dataclass, field
+
+from numba_compat import njit
+
+
+# Every pattern type the detector reports; the index is its integer code
+PATTERN_TYPES: Tuple[str, ...] = (
+    "Head and Shoulders",
+    "Inverse Head and Shoulders",
+    "Double Top",
+    "Double Bottom",
+    "Triple Top",
+    "Triple Bottom",
+    "Rounding Bottom",
+    "Spike V (Bullish)",
+    "Spike V (Bearish)",
+)
+
+PATTERN_TYPE_CODES: Dict[str, int] = {name: code for code, name in enumerate(PATTERN_TYPES)}
+
+# Names of each type's key levels, in PatternBatch.key_levels column order
+# (indexed by type code; spare columns are NaN, except that spikes keep
+# their pivot close in the last one)
+KEY_LEVEL_COLUMNS = 4
+PATTERN_KEY_LEVELS: Tuple[Tuple[str, ...], ...] = (
+    ("head", "left_shoulder", "right_shoulder", "neckline"),
+    ("head", "left_shoulder", "right_shoulder", "neckline"),
+    ("peak1", "peak2", "support"),
+    ("bottom1", "bottom2", "resistance"),
+    ("peak1", "peak2", "peak3", "support"),
+    ("bottom1", "bottom2", "bottom3", "resistance"),
+    ("bottom", "entry", "current"),
+    ("spike_low", "entry", "exit"),
+    ("spike_high", "entry", "exit"),
+)
+
+# Bars a pattern's detection can read after / before its first bar (triple
+# tops reach furthest); PatternStream re-scans only this much on an update.
+# The context also covers the longest (28-bar) candidate that can overlap a
+# pattern, as overlapping candidates decide whether it is reported
+PATTERN_SPAN = 35
+PATTERN_CONTEXT = 15 + 28
+
+# (first idx, second idx, level gap) arrays of equal-level extremum pairs
+LevelPairs = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+# Pattern types that signal a bullish reversal
+BULLISH_PATTERNS: frozenset = frozenset({
+    "Inverse Head and Shoulders",
+    "Double Bottom",
+    "Triple Bottom",
+    "Rounding Bottom",
+    "Spike V (Bullish)",
+})
+
+
+def _as_prices(values) -> np.ndarray:
+    """
+    Get a price series as the compiled kernels take it
+    
+    The kernels' signatures match only contiguous, writeable float64 arrays,
+    so other inputs (including read-only ones) are converted or copied.
+    
+    Args:
+        values: Price series
+        
+    Returns:
+        Contiguous writeable float64 array (values itself when it already is)
+    """
+    return np.require(values, np.float64, ['C', 'W'])
+
+
+def _peak_mask(data: np.ndarray, window: int = 3) -> np.ndarray:
+    """
+    Flag every local peak in one vectorized pass
+    
+    Same test as ReversalPatternDetector._is_local_peak at each index: the
+    bar is the first max of the 2 * window + 1 bars centred on it (so a
+    flat top counts once, at its first bar), and bars within `window` of
+    either end are never peaks.
+    
+    Args:
+        data: Price array
+        window: Bars on each side of the candidate
+        
+    Returns:
+        Boolean array, True at local peaks
+    """
+    n = len(data)
+    mask = np.zeros(n, dtype=bool)
+    if n > 2 * window:
+        windows = sliding_window_view(data, 2 * window + 1)
+        mask[window:n - window] = windows.argmax(axis=1) == window
+    return mask
+
+
+def _trough_mask(data: np.ndarray, window: int = 3) -> np.ndarray:
+    """
+    Flag every local trough in one vectorized pass (see _peak_mask)
+    
+    Args:
+        data: Price array
+        window: Bars on each side of the candidate
+        
+    Returns:
+        Boolean array, True at local troughs
+    """
+    n = len(data)
+    mask = np.zeros(n, dtype=bool)
+    if n > 2 * window:
+        windows = sliding_window_view(data, 2 * window + 1)
+        mask[window:n - window] = windows.argmin(axis=1) == window
+    return mask
+
+
+def _peak_idxs(highs: np.ndarray) -> np.ndarray:
+    """
+    Sorted indices of the local peaks, as int64
+    
+    np.flatnonzero returns intp, which is int32 on Windows with NumPy 1.x;
+    the compiled kernels' signatures take int64 indices on every platform.
+    """
+    return np.flatnonzero(_peak_mask(highs)).astype(np.int64, copy=False)
+
+
+def _trough_idxs(lows: np.ndarray) -> np.ndarray:
+    """Sorted indices of the local troughs, as int64 (see _peak_idxs)"""
+    return np.flatnonzero(_trough_mask(lows)).astype(np.int64, copy=False)
+
+
+def _sparse_table(data: np.ndarray, op: np.ufunc) -> np.ndarray:
+    """
+    Build a sparse table for O(1) range min/max queries
+    
+    Row k holds op over each run of 2**k bars starting at that column
+    (runs are cut short at the end of the array).
+    
+    Args:
+        data: Price array
+        op: np.minimum or np.maximum
+        
+    Returns:
+        (levels, len(data)) float array for _range_min / _range_max
+    """
+    n = len(data)
+    levels = max(n.bit_length(), 1)
+    table = np.empty((levels, n), dtype=np.float64)
+    table[0] = data
+    for k in range(1, levels):
+        half = 1 << (k - 1)
+        op(table[k - 1, :n - half], table[k - 1, half:], out=table[k, :n - half])
+        table[k, n - half:] = table[k - 1, n - half:]
+    return table
+
+
+@njit(cache=True)
+def _table_level(length):
+    """Largest k with 2**k <= length"""
+    k = 0
+    while (2 << k) <= length:
+        k += 1
+    return k
+
+
+@njit(cache=True)
+def _range_min(table, start, stop):
+    """Min of data[start:stop] (non-empty) from _sparse_table(data, np.minimum)"""
+    k = _table_level(stop - start)
+    return min(table[k, start], table[k, stop - (1 << k)])
+
+
+@njit(cache=True)
+def _range_max(table, start, stop):
+    """Max of data[start:stop] (non-empty) from _sparse_table(data, np.maximum)"""
+    k = _table_level(stop - start)
+    return max(table[k, start], table[k, stop - (1 << k)])
+
+
+def _range_extrema(table: np.ndarray, op: np.ufunc, starts: np.ndarray,
+                   stops: np.ndarray) -> np.ndarray:
+    """
+    Vectorized _range_min / _range_max over many ranges at once
+    
+    Args:
+        table: _sparse_table(data, op)
+        op: np.minimum or np.maximum (the one the table was built with)
+        starts: Range starts
+        stops: Range ends (exclusive, each > its start)
+        
+    Returns:
+        op over data[start:stop] for each range
+    """
+    _, exponents = np.frexp(stops - starts)
+    levels = exponents - 1
+    return op(table[levels, starts], table[levels, stops - (1 << levels)])
+
+
+@njit('b1[::1](i8[::1], i8[::1])', cache=True, nogil=True)
+def _non_overlapping(starts, ends):
+    """
+    Overlap filter over candidate patterns ordered by start
+    
+    A candidate is kept only if it starts at or after the end of every
+    earlier candidate, so each run of overlapping candidates reports its
+    first one. Unlike keeping whatever does not overlap the last kept
+    pattern, this only depends on candidates at most one pattern length
+    back, so a pattern never comes and goes as old bars roll off.
+    
+    Args:
+        starts: Candidate start indices, ascending
+        ends: Candidate end indices
+        
+    Returns:
+        Boolean mask, True for each candidate kept
+    """
+    keep = np.zeros(len(starts), dtype=np.bool_)
+    last_end = -1
+    for row in range(len(starts)):
+        keep[row] = starts[row] >= last_end
+        last_end = max(last_end, ends[row])
+    return keep
+
+
+def _equal_level_pairs(levels: np.ndarray, idxs: np.ndarray, tolerance: float) -> LevelPairs:
+    """
+    Find every pair of extrema 5-19 bars apart at matching levels
+    
+    The starting point of both double and triple top/bottom detection;
+    detect_all_patterns finds the pairs once for the two.
+    
+    Args:
+        levels: Highs (for peaks) or lows (for troughs)
+        idxs: Sorted peak or trough indices
+        tolerance: Largest |first - second| as a fraction of first
+        
+    Returns:
+        (first idx, second idx, |first - second| level gap) arrays, ordered
+        by first then second idx; the first is at least 5 bars in and the
+        second before the last bar
+    """
+    n = len(levels)
+    gaps = idxs[None, :] - idxs[:, None]
+    first_pos, second_pos = np.nonzero((gaps >= 5) & (gaps < 20))
+    firsts = idxs[first_pos]
+    seconds = idxs[second_pos]
+    in_range = (firsts >= 5) & (seconds < n - 1)
+    firsts = firsts[in_range]
+    seconds = seconds[in_range]
+    
+    first_levels = levels[firsts]
+    level_gaps = np.abs(first_levels - levels[seconds])
+    similar = level_gaps <= first_levels * tolerance
+    return firsts[similar], seconds[similar], level_gaps[similar]
+
+
+@njit(cache=True)
+def _hs_confidence(head, left_shoulder, right_shoulder, shoulder_diff):
+    """Confidence for an H&S pattern (see _calculate_hs_confidence)"""
+    # Higher confidence if shoulders are more symmetric
+    symmetry_score = 1.0 - shoulder_diff
+    
+    # Higher confidence if head is significantly different from shoulders
+    head_prominence = abs(head - (left_shoulder + right_shoulder) / 2) / head
+    prominence_score = min(head_prominence / 0.05, 1.0)
+    
+    return (symmetry_score * 0.6 + prominence_score * 0.4)
+
+
+@njit('Tuple((i8[::1], i8[::1], i8[::1], f8[::1], f8[::1]))(f8[::1], f8[:, ::1], i8[::1], f8)',
+      cache=True, nogil=True)
+def _hs_kernel(highs, low_mins, peak_idxs, tolerance):
+    """
+    Head and Shoulders search loop
+    
+    Returns:
+        (left shoulder idx, head idx, right shoulder idx, neckline,
+        confidence) arrays, one entry per pattern
+    """
+    n = len(highs)
+    left_idxs = np.empty(n, dtype=np.int64)
+    head_idxs = np.empty(n, dtype=np.int64)
+    right_idxs = np.empty(n, dtype=np.int64)
+    necklines = np.empty(n, dtype=np.float64)
+    confidences = np.empty(n, dtype=np.float64)
+    count = 0
+    
+    # Cursors into the sorted peak indices; both only move forward
+    m = len(peak_idxs)
+    left_pos = 0
+    right_pos = 0
+    
+    for i in range(10, n - 10):
+        # Shoulders are the first peaks in [i-10, i-3) and [i+3, i+10)
+        while left_pos < m and peak_idxs[left_pos] < i - 10:
+            left_pos += 1
+        if left_pos == m or peak_idxs[left_pos] >= i - 3:
+            continue
+        left = peak_idxs[left_pos]
+        
+        while right_pos < m and peak_idxs[right_pos] < i + 3:
+            right_pos += 1
+        if right_pos == m or peak_idxs[right_pos] >= min(i + 10, n - 1):
+            continue
+        right = peak_idxs[right_pos]
+        
+        head = highs[i]
+        left_high = highs[left]
+        right_high = highs[right]
+        if head <= left_high or head <= right_high:
+            continue
+        
+        # Multiply out the tolerance; only matches pay for the division
+        if abs(left_high - right_high) > left_high * tolerance:
+            continue
+        shoulder_diff = abs(left_high - right_high) / left_high
+        
+        left_idxs[count] = left
+        head_idxs[count] = i
+        right_idxs[count] = right
+        necklines[count] = (_range_min(low_mins, left, i) + _range_min(low_mins, i, right)) / 2
+        confidences[count] = _hs_confidence(head, left_high, right_high, shoulder_diff)
+        count += 1
+    
+    return (left_idxs[:count], head_idxs[:count], right_idxs[:count],
+            necklines[:count], confidences[:count])
+
+
+@njit('Tuple((i8[::1], i8[::1], i8[::1], f8[::1], f8[::1]))(f8[:, ::1], f8[::1], i8[::1], f8)',
+      cache=True, nogil=True)
+def _ihs_kernel(high_maxes, lows, trough_idxs, tolerance):
+    """
+    Inverse Head and Shoulders search loop
+    
+    Returns:
+        (left shoulder idx, head idx, right shoulder idx, neckline,
+        confidence) arrays, one entry per pattern
+    """
+    n = len(lows)
+    left_idxs = np.empty(n, dtype=np.int64)
+    head_idxs = np.empty(n, dtype=np.int64)
+    right_idxs = np.empty(n, dtype=np.int64)
+    necklines = np.empty(n, dtype=np.float64)
+    confidences = np.empty(n, dtype=np.float64)
+    count = 0
+    
+    # Cursors into the sorted trough indices; both only move forward
+    m = len(trough_idxs)
+    left_pos = 0
+    right_pos = 0
+    
+    for i in range(10, n - 10):
+        # Shoulders are the first troughs in [i-10, i-3) and [i+3, i+10)
+        while left_pos < m and trough_idxs[left_pos] < i - 10:
+            left_pos += 1
+        if left_pos == m or trough_idxs[left_pos] >= i - 3:
+            continue
+        left = trough_idxs[left_pos]
+        
+        while right_pos < m and trough_idxs[right_pos] < i + 3:
+            right_pos += 1
+        if right_pos == m or trough_idxs[right_pos] >= min(i + 10, n - 1):
+            continue
+        right = trough_idxs[right_pos]
+        
+        head = lows[i]
+        left_low = lows[left]
+        right_low = lows[right]
+        if head >= left_low or head >= right_low:
+            continue
+        
+        # Multiply out the tolerance; only matches pay for the division
+        if abs(left_low - right_low) > left_low * tolerance:
+            continue
+        shoulder_diff = abs(left_low - right_low) / left_low
+        
+        left_idxs[count] = left
+        head_idxs[count] = i
+        right_idxs[count] = right
+        necklines[count] = (_range_max(high_maxes, left, i) + _range_max(high_maxes, i, right)) / 2
+        confidences[count] = _hs_confidence(head, left_low, right_low, shoulder_diff)
+        count += 1
+    
+    return (left_idxs[:count], head_idxs[:count], right_idxs[:count],
+            necklines[:count], confidences[:count])
+
+
+@njit('Tuple((i8[::1], i8[::1], i8[::1], f8[::1]))(f8[::1], f8[:, ::1], i8[::1], i8[::1], i8[::1], f8)',
+      cache=True, nogil=True)
+def _triple_top_kernel(highs, high_mins, peak_idxs, pair_firsts, pair_seconds, tolerance):
+    """
+    Triple Top search loop
+    
+    The second peak is the first local peak 5-14 bars after the first that
+    matches it, read from the _equal_level_pairs output; every matching
+    third peak 5-14 bars after the second is a candidate.
+    
+    Args:
+        pair_firsts: First idx of each equal-level pair, ascending
+        pair_seconds: Second idx of each pair, ascending per first idx
+        
+    Returns:
+        (first, second, third peak idx, support) arrays
+    """
+    n = len(highs)
+    size = len(pair_firsts) * 10
+    first_idxs = np.empty(size, dtype=np.int64)
+    second_idxs = np.empty(size, dtype=np.int64)
+    third_idxs = np.empty(size, dtype=np.int64)
+    supports = np.empty(size, dtype=np.float64)
+    count = 0
+    last_end = -1
+    prev_first = -1
+    
+    for a in range(len(pair_firsts)):
+        # Only each first's earliest pair can give its second
+        i = pair_firsts[a]
+        if i == prev_first:
+            continue
+        prev_first = i
+        if i >= n - 20:
+            break
+        second = pair_seconds[a]
+        if second >= min(i + 15, n - 10):
+            continue
+        second_pos = np.searchsorted(peak_idxs, second)
+        first_peak = highs[i]
+        second_peak = highs[second]
+        
+        for c in range(second_pos + 1, len(peak_idxs)):
+            k = peak_idxs[c]
+            if k < second + 5:
+                continue
+            if k >= min(second + 15, n - 1):
+                break
+            third_peak = highs[k]
+            
+            # All peaks within tolerance of their average: only the highest
+            # and lowest of the three can be furthest from it
+            avg_peak = (first_peak + second_peak + third_peak) / 3
+            highest = max(first_peak, second_peak, third_peak)
+            lowest = min(first_peak, second_peak, third_peak)
+            avg_tol = avg_peak * tolerance
+            if highest - avg_peak > avg_tol or avg_peak - lowest > avg_tol:
+                continue
+            
+            # Only the first of each run of overlapping candidates is
+            # reported (the rule of _non_overlapping)
+            overlaps = i < last_end
+            last_end = max(last_end, k)
+            if overlaps:
+                continue
+            
+            first_idxs[count] = i
+            second_idxs[count] = second
+            third_idxs[count] = k
+            # Lowest high across both gaps between the peaks
+            supports[count] = _range_min(high_mins, i, k)
+            count += 1
+    
+    return first_idxs[:count], second_idxs[:count], third_idxs[:count], supports[:count]
+
+
+@njit('Tuple((i8[::1], i8[::1], i8[::1], f8[::1]))(f8[::1], f8[:, ::1], i8[::1], i8[::1], i8[::1], f8)',
+      cache=True, nogil=True)
+def _triple_bottom_kernel(lows, low_maxes, trough_idxs, pair_firsts, pair_seconds, tolerance):
+    """
+    Triple Bottom search loop (mirror of _triple_top_kernel)
+    
+    Returns:
+        (first, second, third bottom idx, resistance) arrays
+    """
+    n = len(lows)
+    size = len(pair_firsts) * 10
+    first_idxs = np.empty(size, dtype=np.int64)
+    second_idxs = np.empty(size, dtype=np.int64)
+    third_idxs = np.empty(size, dtype=np.int64)
+    resistances = np.empty(size, dtype=np.float64)
+    count = 0
+    last_end = -1
+    prev_first = -1
+    
+    for a in range(len(pair_firsts)):
+        # Only each first's earliest pair can give its second
+        i = pair_firsts[a]
+        if i == prev_first:
+            continue
+        prev_first = i
+        if i >= n - 20:
+            break
+        second = pair_seconds[a]
+        if second >= min(i + 15, n - 10):
+            continue
+        second_pos = np.searchsorted(trough_idxs, second)
+        first_bottom = lows[i]
+        second_bottom = lows[second]
+        
+        for c in range(second_pos + 1, len(trough_idxs)):
+            k = trough_idxs[c]
+            if k < second + 5:
+                continue
+            if k >= min(second + 15, n - 1):
+                break
+            third_bottom = lows[k]
+            
+            # All bottoms within tolerance of their average: only the highest
+            # and lowest of the three can be furthest from it
+            avg_bottom = (first_bottom + second_bottom + third_bottom) / 3
+            highest = max(first_bottom, second_bottom, third_bottom)
+            lowest = min(first_bottom, second_bottom, third_bottom)
+            avg_tol = avg_bottom * tolerance
+            if highest - avg_bottom > avg_tol or avg_bottom - lowest > avg_tol:
+                continue
+            
+            # Only the first of each run of overlapping candidates is
+            # reported (the rule of _non_overlapping)
+            overlaps = i < last_end
+            last_end = max(last_end, k)
+            if overlaps:
+                continue
+            
+            first_idxs[count] = i
+            second_idxs[count] = second
+            third_idxs[count] = k
+            # Highest low across both gaps between the bottoms
+            resistances[count] = _range_max(low_maxes, i, k)
+            count += 1
+    
+    return first_idxs[:count], second_idxs[:count], third_idxs[:count], resistances[:count]
+
+
+@njit(cache=True)
+def _slope(values, start, stop):
+    """
+    Least-squares slope of values[start:stop] against 0..k-1
+    
+    Closed form of np.polyfit(range(k), y, 1)[0]. The integer weights
+    2x - (k - 1) keep the sum exact for tick-sized prices, so a flat run
+    gets a slope of exactly zero rather than rounding noise of either sign.
+    """
+    k = stop - start
+    num = 0.0
+    den = 0.0
+    for x in range(k):
+        weight = 2.0 * x - (k - 1)
+        num += weight * values[start + x]
+        den += weight * weight
+    return num * (2.0 / den)
+
+
+@njit('Tuple((i8[::1], f8[::1], f8[::1]))(f8[::1], i8)',
+      cache=True, nogil=True)
+def _rounding_bottom_kernel(lows, window_size):
+    """
+    Rounding Bottom search over every window that ends before the last bar
+    
+    Returns:
+        (window start idx, bottom level, confidence) arrays
+    """
+    n = len(lows)
+    third = window_size // 3
+    two_thirds = 2 * window_size // 3
+    size = max(n - window_size, 0)
+    starts = np.empty(size, dtype=np.int64)
+    bottoms = np.empty(size, dtype=np.float64)
+    confidences = np.empty(size, dtype=np.float64)
+    count = 0
+    
+    for i in range(n - window_size):
+        # Middle third should be lower (on average) than both sides. Each
+        # third is summed directly: prefix sums would save a few additions
+        # but their rounding flips exact ties on tick-quantized prices.
+        # The right third is only summed if the left test passes
+        middle_sum = 0.0
+        for k in range(i + third, i + two_thirds):
+            middle_sum += lows[k]
+        middle_mean = middle_sum / (two_thirds - third)
+        
+        left_sum = 0.0
+        for k in range(i, i + third):
+            left_sum += lows[k]
+        if middle_mean >= left_sum / third:
+            continue
+        
+        right_sum = 0.0
+        for k in range(i + two_thirds, i + window_size):
+            right_sum += lows[k]
+        if middle_mean >= right_sum / (window_size - two_thirds):
+            continue
+        
+        # Left should descend, right should ascend
+        left_slope = _slope(lows, i, i + third)
+        right_slope = _slope(lows, i + two_thirds, i + window_size)
+        if left_slope >= 0 or right_slope <= 0:
+            continue
+        
+        # Check symmetry
+        asymmetry = abs(abs(left_slope) - abs(right_slope)) / abs(left_slope)
+        if asymmetry > 0.5:
+            continue
+        
+        starts[count] = i
+        bottoms[count] = np.min(lows[i:i + window_size])
+        confidences[count] = 1.0 - asymmetry
+        count += 1
+    
+    return starts[:count], bottoms[:count], confidences[:count]
+
+
+def _describe(code: int, levels: List[float]) -> str:
+    """Build a pattern's description from its type code and key levels"""
+    name = PATTERN_TYPES[code]
+    if name == "Head and Shoulders":
+        return f"Bearish H&S: Head={levels[0]:.2f}, Neckline={levels[3]:.2f}"
+    if name == "Inverse Head and Shoulders":
+        return f"Bullish IH&S: Head={levels[0]:.2f}, Neckline={levels[3]:.2f}"
+    if name == "Double Top":
+        return f"Bearish Double Top: Peaks={levels[0]:.2f}, Support={levels[2]:.2f}"
+    if name == "Double Bottom":
+        return f"Bullish Double Bottom: Bottoms={levels[0]:.2f}, Resistance={levels[2]:.2f}"
+    if name == "Triple Top":
+        avg_peak = (levels[0] + levels[1] + levels[2]) / 3
+        return f"Bearish Triple Top: Peaks≈{avg_peak:.2f}, Support={levels[3]:.2f}"
+    if name == "Triple Bottom":
+        avg_bottom = (levels[0] + levels[1] + levels[2]) / 3
+        return f"Bullish Triple Bottom: Bottoms≈{avg_bottom:.2f}, Resistance={levels[3]:.2f}"
+    if name == "Rounding Bottom":
+        return f"Bullish Rounding Bottom: Bottom={levels[0]:.2f}, Current={levels[2]:.2f}"
+    
+    # Spikes keep the pivot close in their spare column
+    after = (levels[2] - levels[3]) / levels[3]
+    if name == "Spike V (Bullish)":
+        return f"Bullish Spike: Low={levels[0]:.2f}, Recovery={after*100:.1f}%"
+    return f"Bearish Spike: High={levels[0]:.2f}, Drop={after*100:.1f}%"
 
 
 @dataclass
@@ -16,24 +651,196 @@ class Pattern:
     end_idx: int
     key_levels: Dict[str, float]
     description: str
+    is_bullish: bool = field(init=False)
+    
+    def __post_init__(self):
+        self.is_bullish = self.pattern_type in BULLISH_PATTERNS
+
+
+@dataclass(eq=False)
+class PatternBatch:
+    """
+    Detected patterns stored as parallel arrays, one row per pattern
+    
+    Filtering and sorting work on the columns (e.g. a single
+    `batch.confidence >= threshold` compare) instead of attribute lookups
+    per pattern. Pattern objects are only built when a row is read, so the
+    batch still behaves as a sequence of Pattern objects.
+    """
+    pattern_type: np.ndarray  # int8 codes into PATTERN_TYPES
+    confidence: np.ndarray
+    start_idx: np.ndarray
+    end_idx: np.ndarray
+    key_levels: np.ndarray  # (N, KEY_LEVEL_COLUMNS), named by PATTERN_KEY_LEVELS
+    
+    @classmethod
+    def empty(cls) -> "PatternBatch":
+        """Batch with no patterns"""
+        return cls.from_columns(0, 0.0, np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+    
+    @classmethod
+    def from_columns(cls, pattern_type, confidence, start_idx: np.ndarray,
+                     end_idx: np.ndarray, *levels) -> "PatternBatch":
+        """
+        Build a batch from detector output
+        
+        Args:
+            pattern_type: Type code, for every row or per row
+            confidence: Confidence, for every row or per row
+            start_idx: Pattern start indices
+            end_idx: Pattern end indices
+            levels: Key level columns in PATTERN_KEY_LEVELS order (unused
+                columns are NaN)
+            
+        Returns:
+            PatternBatch with one row per start index
+        """
+        n = len(start_idx)
+        key_levels = np.full((n, KEY_LEVEL_COLUMNS), np.nan)
+        for col, level in enumerate(levels):
+            key_levels[:, col] = level
+        
+        return cls(
+            pattern_type=np.full(n, pattern_type, dtype=np.int8),
+            confidence=np.full(n, confidence, dtype=np.float64),
+            start_idx=np.asarray(start_idx, dtype=np.int64),
+            end_idx=np.asarray(end_idx, dtype=np.int64),
+            key_levels=key_levels,
+        )
+    
+    @classmethod
+    def concat(cls, batches: List["PatternBatch"]) -> "PatternBatch":
+        """Join batches end to end"""
+        if not batches:
+            return cls.empty()
+        
+        return cls(
+            pattern_type=np.concatenate([b.pattern_type for b in batches]),
+            confidence=np.concatenate([b.confidence for b in batches]),
+            start_idx=np.concatenate([b.start_idx for b in batches]),
+            end_idx=np.concatenate([b.end_idx for b in batches]),
+            key_levels=np.concatenate([b.key_levels for b in batches]),
+        )
+    
+    def take(self, idxs: np.ndarray) -> "PatternBatch":
+        """
+        Get a batch of the selected rows
+        
+        Args:
+            idxs: Integer positions or a boolean mask over the rows
+            
+        Returns:
+            PatternBatch of the selected rows
+        """
+        return PatternBatch(
+            pattern_type=self.pattern_type[idxs],
+            confidence=self.confidence[idxs],
+            start_idx=self.start_idx[idxs],
+            end_idx=self.end_idx[idxs],
+            key_levels=self.key_levels[idxs],
+        )
+    
+    def shifted(self, offset: int) -> "PatternBatch":
+        """Get the batch with its bar indices moved by offset"""
+        return PatternBatch(
+            pattern_type=self.pattern_type,
+            confidence=self.confidence,
+            start_idx=self.start_idx + offset,
+            end_idx=self.end_idx + offset,
+            key_levels=self.key_levels,
+        )
+    
+    def to_patterns(self) -> List[Pattern]:
+        """Build the Pattern object of every row"""
+        return list(self)
+    
+    @staticmethod
+    def _pattern(code: int, confidence: float, start_idx: int, end_idx: int,
+                 levels: List[float]) -> Pattern:
+        """Build the Pattern object of one row from its Python values"""
+        return Pattern(
+            pattern_type=PATTERN_TYPES[code],
+            confidence=confidence,
+            start_idx=start_idx,
+            end_idx=end_idx,
+            key_levels=dict(zip(PATTERN_KEY_LEVELS[code], levels)),
+            description=_describe(code, levels)
+        )
+    
+    def __len__(self) -> int:
+        return len(self.start_idx)
+    
+    def __iter__(self) -> Iterator[Pattern]:
+        # Convert each column to Python values once instead of indexing
+        # five arrays per row
+        rows = zip(self.pattern_type.tolist(), self.confidence.tolist(),
+                   self.start_idx.tolist(), self.end_idx.tolist(), self.key_levels.tolist())
+        build = self._pattern
+        return (build(*row) for row in rows)
+    
+    def __getitem__(self, idx: int) -> Pattern:
+        return self._pattern(int(self.pattern_type[idx]), float(self.confidence[idx]),
+                             int(self.start_idx[idx]), int(self.end_idx[idx]),
+                             self.key_levels[idx].tolist())
+    
+    def select(self, idxs: np.ndarray) -> List[Pattern]:
+        """
+        Get the patterns at the given positions
+        
+        Args:
+            idxs: Integer positions, e.g. from np.flatnonzero(mask)
+            
+        Returns:
+            List of the selected patterns
+        """
+        return list(self.take(idxs))
 
 
 class ReversalPatternDetector:
     """Detects reversal patterns in OHLCV data"""
     
-    def __init__(self, tolerance: float = 0.02, min_bars: int = 10):
+    def __init__(self, tolerance: float = 0.02, min_bars: int = 10, workers: int = 1,
+                 tick_size: Optional[float] = None):
         """
         Initialize pattern detector
         
         Args:
             tolerance: Price tolerance for pattern matching (2% default)
             min_bars: Minimum bars required for pattern detection
+            workers: Threads the pattern types are detected on (1 = serial)
+            tick_size: Price increment of the instrument (e.g. 0.01 for
+                XAU/USD); when set, prices are compared as whole ticks
         """
         self.tolerance = tolerance
         self.min_bars = min_bars
+        self.tick_size = tick_size
+        
+        # The compiled search kernels release the GIL, so detectors can run
+        # in parallel on this pool; it only pays off for very long windows
+        # (and never without numba), so by default there is none
+        self._executor = (ThreadPoolExecutor(max_workers=workers, thread_name_prefix="detector")
+                          if workers > 1 else None)
+    
+    @property
+    def parallel(self) -> bool:
+        """Whether detect_all_patterns runs the detectors on a thread pool"""
+        return self._executor is not None
+    
+    def close(self):
+        """Shut down the detector thread pool (if any)"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
     
     def detect_all_patterns(self, highs: np.ndarray, lows: np.ndarray, 
-                           closes: np.ndarray) -> List[Pattern]:
+                           closes: np.ndarray) -> PatternBatch:
         """
         Detect all reversal patterns in the data
         
@@ -43,540 +850,322 @@ class ReversalPatternDetector:
             closes: Array of close prices
             
         Returns:
-            List of detected patterns
+            PatternBatch of detected patterns (iterates as Pattern objects)
         """
-        patterns = []
+        # Too short for any pattern: skip all eight detectors at once
+        if len(highs) < self.min_bars:
+            return PatternBatch.empty()
+        
+        # The compiled kernels take contiguous writeable float64 arrays;
+        # converting here makes the detectors' own conversions no-ops
+        highs = _as_prices(highs)
+        lows = _as_prices(lows)
+        closes = _as_prices(closes)
+        
+        # In whole ticks (integers, which float64 holds exactly) every sum
+        # and comparison is exact, so feed noise like 1.1000000001 cannot
+        # break ties; key levels are scaled back to prices at the end
+        if self.tick_size:
+            highs = np.rint(highs / self.tick_size)
+            lows = np.rint(lows / self.tick_size)
+            closes = np.rint(closes / self.tick_size)
+        
+        # Local peaks/troughs are shared by most detectors: find them once and
+        # pass their sorted indices, so each search visits only those bars
+        peaks = _peak_idxs(highs)
+        troughs = _trough_idxs(lows)
         
-        # Detect each pattern type
-        patterns.extend(self.detect_head_and_shoulders(highs, lows, closes))
-        patterns.extend(self.detect_inverse_head_and_shoulders(highs, lows, closes))
-        patterns.extend(self.detect_double_top(highs, closes))
-        patterns.extend(self.detect_double_bottom(lows, closes))
-        patterns.extend(self.detect_triple_top(highs, closes))
-        patterns.extend(self.detect_triple_bottom(lows, closes))
-        patterns.extend(self.detect_rounding_bottom(lows, closes))
-        patterns.extend(self.detect_spike_pattern(highs, lows, closes))
+        # Equal-level pairs start both double and triple tops/bottoms
+        peak_pairs = _equal_level_pairs(highs, peaks, self.tolerance)
+        trough_pairs = _equal_level_pairs(lows, troughs, self.tolerance)
         
-        return patterns
+        # Detect each pattern type (the detectors are independent)
+        detectors = [
+            (self.detect_head_and_shoulders, (highs, lows, closes), {'peaks': peaks}),
+            (self.detect_inverse_head_and_shoulders, (highs, lows, closes), {'troughs': troughs}),
+            (self.detect_double_top, (highs, closes), {'peaks': peaks, 'pairs': peak_pairs}),
+            (self.detect_double_bottom, (lows, closes), {'troughs': troughs, 'pairs': trough_pairs}),
+            (self.detect_triple_top, (highs, closes), {'peaks': peaks, 'pairs': peak_pairs}),
+            (self.detect_triple_bottom, (lows, closes), {'troughs': troughs, 'pairs': trough_pairs}),
+            (self.detect_rounding_bottom, (lows, closes), {}),
+            (self.detect_spike_pattern, (highs, lows, closes), {}),
+        ]
+        if self._executor is None:
+            batches = [detect(*args, **kwargs) for detect, args, kwargs in detectors]
+        else:
+            futures = [self._executor.submit(detect, *args, **kwargs)
+                       for detect, args, kwargs in detectors]
+            batches = [future.result() for future in futures]
+        
+        batch = PatternBatch.concat(batches)
+        if self.tick_size:
+            batch.key_levels *= self.tick_size
+        return batch
     
     def detect_head_and_shoulders(self, highs: np.ndarray, lows: np.ndarray, 
-                                  closes: np.ndarray) -> List[Pattern]:
+                                  closes: np.ndarray,
+                                  peaks: Optional[np.ndarray] = None) -> PatternBatch:
         """
         Detect Head and Shoulders pattern (bearish reversal)
         Pattern: Left Shoulder < Head > Right Shoulder with neckline support
         """
-        patterns = []
         n = len(highs)
         
         if n < 20:
-            return patterns
+            return PatternBatch.empty()
         
-        # Look for three peaks
-        for i in range(10, n - 10):
-            # Find potential head (highest point)
-            head_idx = i
-            head_high = highs[head_idx]
-            
-            # Find left shoulder (peak before head)
-            left_shoulder_idx = None
-            for j in range(head_idx - 10, head_idx - 3):
-                if self._is_local_peak(highs, j, window=3):
-                    left_shoulder_idx = j
-                    break
-            
-            if left_shoulder_idx is None:
-                continue
-            
-            # Find right shoulder (peak after head)
-            right_shoulder_idx = None
-            for j in range(head_idx + 3, min(head_idx + 10, n - 1)):
-                if self._is_local_peak(highs, j, window=3):
-                    right_shoulder_idx = j
-                    break
-            
-            if right_shoulder_idx is None:
-                continue
-            
-            left_shoulder_high = highs[left_shoulder_idx]
-            right_shoulder_high = highs[right_shoulder_idx]
-            
-            # Validate pattern structure
-            # 1. Head should be higher than both shoulders
-            if head_high <= left_shoulder_high or head_high <= right_shoulder_high:
-                continue
-            
-            # 2. Shoulders should be roughly equal height
-            shoulder_diff = abs(left_shoulder_high - right_shoulder_high) / left_shoulder_high
-            if shoulder_diff > self.tolerance:
-                continue
-            
-            # 3. Find neckline (support level connecting troughs)
-            trough1_idx = left_shoulder_idx + np.argmin(lows[left_shoulder_idx:head_idx])
-            trough2_idx = head_idx + np.argmin(lows[head_idx:right_shoulder_idx])
-            neckline = (lows[trough1_idx] + lows[trough2_idx]) / 2
-            
-            # Calculate confidence
-            confidence = self._calculate_hs_confidence(
-                head_high, left_shoulder_high, right_shoulder_high, shoulder_diff
-            )
-            
-            pattern = Pattern(
-                pattern_type="Head and Shoulders",
-                confidence=confidence,
-                start_idx=left_shoulder_idx,
-                end_idx=right_shoulder_idx,
-                key_levels={
-                    "head": head_high,
-                    "left_shoulder": left_shoulder_high,
-                    "right_shoulder": right_shoulder_high,
-                    "neckline": neckline
-                },
-                description=f"Bearish H&S: Head={head_high:.2f}, Neckline={neckline:.2f}"
-            )
-            patterns.append(pattern)
-        
-        return patterns
+        if peaks is None:
+            peaks = _peak_idxs(highs)
+        
+        highs = _as_prices(highs)
+        low_mins = _sparse_table(lows, np.minimum)
+        left_shoulders, heads, right_shoulders, necklines, confidences = _hs_kernel(
+            highs, low_mins, peaks, self.tolerance
+        )
+        
+        return PatternBatch.from_columns(
+            PATTERN_TYPE_CODES["Head and Shoulders"], confidences,
+            left_shoulders, right_shoulders,
+            highs[heads], highs[left_shoulders], highs[right_shoulders], necklines
+        )
     
     def detect_inverse_head_and_shoulders(self, highs: np.ndarray, lows: np.ndarray, 
-                                         closes: np.ndarray) -> List[Pattern]:
+                                         closes: np.ndarray,
+                                         troughs: Optional[np.ndarray] = None) -> PatternBatch:
         """
         Detect Inverse Head and Shoulders pattern (bullish reversal)
         Pattern: Left Shoulder > Head < Right Shoulder with neckline resistance
         """
-        patterns = []
         n = len(lows)
         
         if n < 20:
-            return patterns
+            return PatternBatch.empty()
         
-        # Look for three troughs
-        for i in range(10, n - 10):
-            # Find potential head (lowest point)
-            head_idx = i
-            head_low = lows[head_idx]
-            
-            # Find left shoulder (trough before head)
-            left_shoulder_idx = None
-            for j in range(head_idx - 10, head_idx - 3):
-                if self._is_local_trough(lows, j, window=3):
-                    left_shoulder_idx = j
-                    break
-            
-            if left_shoulder_idx is None:
-                continue
-            
-            # Find right shoulder (trough after head)
-            right_shoulder_idx = None
-            for j in range(head_idx + 3, min(head_idx + 10, n - 1)):
-                if self._is_local_trough(lows, j, window=3):
-                    right_shoulder_idx = j
-                    break
-            
-            if right_shoulder_idx is None:
-                continue
-            
-            left_shoulder_low = lows[left_shoulder_idx]
-            right_shoulder_low = lows[right_shoulder_idx]
-            
-            # Validate pattern structure
-            # 1. Head should be lower than both shoulders
-            if head_low >= left_shoulder_low or head_low >= right_shoulder_low:
-                continue
-            
-            # 2. Shoulders should be roughly equal depth
-            shoulder_diff = abs(left_shoulder_low - right_shoulder_low) / left_shoulder_low
-            if shoulder_diff > self.tolerance:
-                continue
-            
-            # 3. Find neckline (resistance level connecting peaks)
-            peak1_idx = left_shoulder_idx + np.argmax(highs[left_shoulder_idx:head_idx])
-            peak2_idx = head_idx + np.argmax(highs[head_idx:right_shoulder_idx])
-            neckline = (highs[peak1_idx] + highs[peak2_idx]) / 2
-            
-            # Calculate confidence
-            confidence = self._calculate_hs_confidence(
-                head_low, left_shoulder_low, right_shoulder_low, shoulder_diff
-            )
-            
-            pattern = Pattern(
-                pattern_type="Inverse Head and Shoulders",
-                confidence=confidence,
-                start_idx=left_shoulder_idx,
-                end_idx=right_shoulder_idx,
-                key_levels={
-                    "head": head_low,
-                    "left_shoulder": left_shoulder_low,
-                    "right_shoulder": right_shoulder_low,
-                    "neckline": neckline
-                },
-                description=f"Bullish IH&S: Head={head_low:.2f}, Neckline={neckline:.2f}"
-            )
-            patterns.append(pattern)
-        
-        return patterns
-    
-    def detect_double_top(self, highs: np.ndarray, closes: np.ndarray) -> List[Pattern]:
+        if troughs is None:
+            troughs = _trough_idxs(lows)
+        
+        lows = _as_prices(lows)
+        high_maxes = _sparse_table(highs, np.maximum)
+        left_shoulders, heads, right_shoulders, necklines, confidences = _ihs_kernel(
+            high_maxes, lows, troughs, self.tolerance
+        )
+        
+        return PatternBatch.from_columns(
+            PATTERN_TYPE_CODES["Inverse Head and Shoulders"], confidences,
+            left_shoulders, right_shoulders,
+            lows[heads], lows[left_shoulders], lows[right_shoulders], necklines
+        )
+    
+    def detect_double_top(self, highs: np.ndarray, closes: np.ndarray,
+                          peaks: Optional[np.ndarray] = None,
+                          pairs: Optional[LevelPairs] = None) -> PatternBatch:
         """
         Detect Double Top pattern (bearish reversal)
         Two peaks at similar price levels
         """
-        patterns = []
         n = len(highs)
         
         if n < 15:
-            return patterns
+            return PatternBatch.empty()
         
-        for i in range(5, n - 10):
-            if not self._is_local_peak(highs, i, window=3):
-                continue
-            
-            first_peak = highs[i]
-            
-            # Look for second peak
-            for j in range(i + 5, min(i + 20, n - 1)):
-                if not self._is_local_peak(highs, j, window=3):
-                    continue
-                
-                second_peak = highs[j]
-                
-                # Check if peaks are at similar levels
-                peak_diff = abs(first_peak - second_peak) / first_peak
-                if peak_diff > self.tolerance:
-                    continue
-                
-                # Find valley between peaks
-                valley_idx = i + np.argmin(highs[i:j])
-                valley_level = highs[valley_idx]
-                
-                # Validate pattern: valley should be significantly lower
-                if (first_peak - valley_level) / first_peak < 0.02:
-                    continue
-                
-                confidence = 1.0 - peak_diff
-                
-                pattern = Pattern(
-                    pattern_type="Double Top",
-                    confidence=confidence,
-                    start_idx=i,
-                    end_idx=j,
-                    key_levels={
-                        "peak1": first_peak,
-                        "peak2": second_peak,
-                        "support": valley_level
-                    },
-                    description=f"Bearish Double Top: Peaks={first_peak:.2f}, Support={valley_level:.2f}"
-                )
-                patterns.append(pattern)
-        
-        return patterns
-    
-    def detect_double_bottom(self, lows: np.ndarray, closes: np.ndarray) -> List[Pattern]:
+        if peaks is None:
+            peaks = _peak_idxs(highs)
+        
+        # Every peak pair 5-19 bars apart at similar levels, evaluated as
+        # arrays (the first peak also has to leave 10 bars after it)
+        if pairs is None:
+            pairs = _equal_level_pairs(highs, peaks, self.tolerance)
+        firsts, seconds, level_gaps = pairs
+        in_range = firsts < n - 10
+        firsts = firsts[in_range]
+        seconds = seconds[in_range]
+        first_levels = highs[firsts]
+        diffs = level_gaps[in_range] / first_levels
+        
+        # Validate pattern: valley between the peaks must be significantly lower
+        high_mins = _sparse_table(highs, np.minimum)
+        between = _range_extrema(high_mins, np.minimum, firsts, seconds)
+        pronounced = ~(first_levels - between < first_levels * 0.02)
+        firsts = firsts[pronounced]
+        seconds = seconds[pronounced]
+        
+        # Report the first pair of each run of overlapping pairs
+        keep = _non_overlapping(firsts, seconds)
+        firsts = firsts[keep]
+        seconds = seconds[keep]
+        
+        return PatternBatch.from_columns(
+            PATTERN_TYPE_CODES["Double Top"], 1.0 - diffs[pronounced][keep], firsts, seconds,
+            highs[firsts], highs[seconds], between[pronounced][keep]
+        )
+    
+    def detect_double_bottom(self, lows: np.ndarray, closes: np.ndarray,
+                             troughs: Optional[np.ndarray] = None,
+                             pairs: Optional[LevelPairs] = None) -> PatternBatch:
         """
         Detect Double Bottom pattern (bullish reversal)
         Two troughs at similar price levels
         """
-        patterns = []
         n = len(lows)
         
         if n < 15:
-            return patterns
+            return PatternBatch.empty()
         
-        for i in range(5, n - 10):
-            if not self._is_local_trough(lows, i, window=3):
-                continue
-            
-            first_bottom = lows[i]
-            
-            # Look for second bottom
-            for j in range(i + 5, min(i + 20, n - 1)):
-                if not self._is_local_trough(lows, j, window=3):
-                    continue
-                
-                second_bottom = lows[j]
-                
-                # Check if bottoms are at similar levels
-                bottom_diff = abs(first_bottom - second_bottom) / first_bottom
-                if bottom_diff > self.tolerance:
-                    continue
-                
-                # Find peak between bottoms
-                peak_idx = i + np.argmax(lows[i:j])
-                peak_level = lows[peak_idx]
-                
-                # Validate pattern: peak should be significantly higher
-                if (peak_level - first_bottom) / first_bottom < 0.02:
-                    continue
-                
-                confidence = 1.0 - bottom_diff
-                
-                pattern = Pattern(
-                    pattern_type="Double Bottom",
-                    confidence=confidence,
-                    start_idx=i,
-                    end_idx=j,
-                    key_levels={
-                        "bottom1": first_bottom,
-                        "bottom2": second_bottom,
-                        "resistance": peak_level
-                    },
-                    description=f"Bullish Double Bottom: Bottoms={first_bottom:.2f}, Resistance={peak_level:.2f}"
-                )
-                patterns.append(pattern)
-        
-        return patterns
-    
-    def detect_triple_top(self, highs: np.ndarray, closes: np.ndarray) -> List[Pattern]:
+        if troughs is None:
+            troughs = _trough_idxs(lows)
+        
+        # Every trough pair 5-19 bars apart at similar levels, evaluated as
+        # arrays (the first trough also has to leave 10 bars after it)
+        if pairs is None:
+            pairs = _equal_level_pairs(lows, troughs, self.tolerance)
+        firsts, seconds, level_gaps = pairs
+        in_range = firsts < n - 10
+        firsts = firsts[in_range]
+        seconds = seconds[in_range]
+        first_levels = lows[firsts]
+        diffs = level_gaps[in_range] / first_levels
+        
+        # Validate pattern: peak between the bottoms must be significantly higher
+        low_maxes = _sparse_table(lows, np.maximum)
+        between = _range_extrema(low_maxes, np.maximum, firsts, seconds)
+        pronounced = ~(between - first_levels < first_levels * 0.02)
+        firsts = firsts[pronounced]
+        seconds = seconds[pronounced]
+        
+        # Report the first pair of each run of overlapping pairs
+        keep = _non_overlapping(firsts, seconds)
+        firsts = firsts[keep]
+        seconds = seconds[keep]
+        
+        return PatternBatch.from_columns(
+            PATTERN_TYPE_CODES["Double Bottom"], 1.0 - diffs[pronounced][keep], firsts, seconds,
+            lows[firsts], lows[seconds], between[pronounced][keep]
+        )
+    
+    def detect_triple_top(self, highs: np.ndarray, closes: np.ndarray,
+                          peaks: Optional[np.ndarray] = None,
+                          pairs: Optional[LevelPairs] = None) -> PatternBatch:
         """
         Detect Triple Top pattern (bearish reversal)
         Three peaks at similar price levels
         """
-        patterns = []
         n = len(highs)
         
         if n < 25:
-            return patterns
+            return PatternBatch.empty()
         
-        for i in range(5, n - 20):
-            if not self._is_local_peak(highs, i, window=3):
-                continue
-            
-            first_peak = highs[i]
-            
-            # Look for second peak
-            second_peak_idx = None
-            for j in range(i + 5, min(i + 15, n - 10)):
-                if self._is_local_peak(highs, j, window=3):
-                    if abs(highs[j] - first_peak) / first_peak <= self.tolerance:
-                        second_peak_idx = j
-                        break
-            
-            if second_peak_idx is None:
-                continue
-            
-            # Look for third peak
-            for k in range(second_peak_idx + 5, min(second_peak_idx + 15, n - 1)):
-                if not self._is_local_peak(highs, k, window=3):
-                    continue
-                
-                third_peak = highs[k]
-                
-                # Check if all peaks are at similar levels
-                avg_peak = (first_peak + highs[second_peak_idx] + third_peak) / 3
-                if abs(first_peak - avg_peak) / avg_peak > self.tolerance:
-                    continue
-                if abs(highs[second_peak_idx] - avg_peak) / avg_peak > self.tolerance:
-                    continue
-                if abs(third_peak - avg_peak) / avg_peak > self.tolerance:
-                    continue
-                
-                # Find support level
-                support = min(np.min(highs[i:second_peak_idx]), 
-                            np.min(highs[second_peak_idx:k]))
-                
-                confidence = 0.95
-                
-                pattern = Pattern(
-                    pattern_type="Triple Top",
-                    confidence=confidence,
-                    start_idx=i,
-                    end_idx=k,
-                    key_levels={
-                        "peak1": first_peak,
-                        "peak2": highs[second_peak_idx],
-                        "peak3": third_peak,
-                        "support": support
-                    },
-                    description=f"Bearish Triple Top: Peaks≈{avg_peak:.2f}, Support={support:.2f}"
-                )
-                patterns.append(pattern)
-        
-        return patterns
-    
-    def detect_triple_bottom(self, lows: np.ndarray, closes: np.ndarray) -> List[Pattern]:
+        if peaks is None:
+            peaks = _peak_idxs(highs)
+        
+        # The kernel extends equal-level pairs instead of searching them again
+        if pairs is None:
+            pairs = _equal_level_pairs(highs, peaks, self.tolerance)
+        pair_firsts, pair_seconds, _ = pairs
+        
+        highs = _as_prices(highs)
+        high_mins = _sparse_table(highs, np.minimum)
+        firsts, seconds, thirds, supports = _triple_top_kernel(
+            highs, high_mins, peaks, pair_firsts, pair_seconds, self.tolerance
+        )
+        
+        return PatternBatch.from_columns(
+            PATTERN_TYPE_CODES["Triple Top"], 0.95, firsts, thirds,
+            highs[firsts], highs[seconds], highs[thirds], supports
+        )
+    
+    def detect_triple_bottom(self, lows: np.ndarray, closes: np.ndarray,
+                             troughs: Optional[np.ndarray] = None,
+                             pairs: Optional[LevelPairs] = None) -> PatternBatch:
         """
         Detect Triple Bottom pattern (bullish reversal)
         Three troughs at similar price levels
         """
-        patterns = []
         n = len(lows)
         
         if n < 25:
-            return patterns
+            return PatternBatch.empty()
         
-        for i in range(5, n - 20):
-            if not self._is_local_trough(lows, i, window=3):
-                continue
-            
-            first_bottom = lows[i]
-            
-            # Look for second bottom
-            second_bottom_idx = None
-            for j in range(i + 5, min(i + 15, n - 10)):
-                if self._is_local_trough(lows, j, window=3):
-                    if abs(lows[j] - first_bottom) / first_bottom <= self.tolerance:
-                        second_bottom_idx = j
-                        break
-            
-            if second_bottom_idx is None:
-                continue
-            
-            # Look for third bottom
-            for k in range(second_bottom_idx + 5, min(second_bottom_idx + 15, n - 1)):
-                if not self._is_local_trough(lows, k, window=3):
-                    continue
-                
-                third_bottom = lows[k]
-                
-                # Check if all bottoms are at similar levels
-                avg_bottom = (first_bottom + lows[second_bottom_idx] + third_bottom) / 3
-                if abs(first_bottom - avg_bottom) / avg_bottom > self.tolerance:
-                    continue
-                if abs(lows[second_bottom_idx] - avg_bottom) / avg_bottom > self.tolerance:
-                    continue
-                if abs(third_bottom - avg_bottom) / avg_bottom > self.tolerance:
-                    continue
-                
-                # Find resistance level
-                resistance = max(np.max(lows[i:second_bottom_idx]), 
-                               np.max(lows[second_bottom_idx:k]))
-                
-                confidence = 0.95
-                
-                pattern = Pattern(
-                    pattern_type="Triple Bottom",
-                    confidence=confidence,
-                    start_idx=i,
-                    end_idx=k,
-                    key_levels={
-                        "bottom1": first_bottom,
-                        "bottom2": lows[second_bottom_idx],
-                        "bottom3": third_bottom,
-                        "resistance": resistance
-                    },
-                    description=f"Bullish Triple Bottom: Bottoms≈{avg_bottom:.2f}, Resistance={resistance:.2f}"
-                )
-                patterns.append(pattern)
-        
-        return patterns
-    
-    def detect_rounding_bottom(self, lows: np.ndarray, closes: np.ndarray) -> List[Pattern]:
+        if troughs is None:
+            troughs = _trough_idxs(lows)
+        
+        # The kernel extends equal-level pairs instead of searching them again
+        if pairs is None:
+            pairs = _equal_level_pairs(lows, troughs, self.tolerance)
+        pair_firsts, pair_seconds, _ = pairs
+        
+        lows = _as_prices(lows)
+        low_maxes = _sparse_table(lows, np.maximum)
+        firsts, seconds, thirds, resistances = _triple_bottom_kernel(
+            lows, low_maxes, troughs, pair_firsts, pair_seconds, self.tolerance
+        )
+        
+        return PatternBatch.from_columns(
+            PATTERN_TYPE_CODES["Triple Bottom"], 0.95, firsts, thirds,
+            lows[firsts], lows[seconds], lows[thirds], resistances
+        )
+    
+    def detect_rounding_bottom(self, lows: np.ndarray, closes: np.ndarray) -> PatternBatch:
         """
         Detect Rounding Bottom pattern (bullish reversal)
         Gradual U-shaped curve
         """
-        patterns = []
         n = len(lows)
         
         if n < 30:
-            return patterns
+            return PatternBatch.empty()
         
-        # Use sliding window to detect U-shape
+        # Use sliding window to detect U-shape. The kernel walks the windows
+        # itself: screening the thirds' means over a sliding_window_view
+        # first measured ~3x slower, as the slope checks dominate and most
+        # windows survive the screen
         window_size = 20
-        for i in range(n - window_size):
-            window = lows[i:i + window_size]
-            
-            # Check if it forms a U-shape
-            left_third = window[:window_size // 3]
-            middle_third = window[window_size // 3:2 * window_size // 3]
-            right_third = window[2 * window_size // 3:]
-            
-            # Middle should be lower than sides
-            if np.mean(middle_third) >= np.mean(left_third) or \
-               np.mean(middle_third) >= np.mean(right_third):
-                continue
-            
-            # Check for gradual descent and ascent
-            left_slope = np.polyfit(range(len(left_third)), left_third, 1)[0]
-            right_slope = np.polyfit(range(len(right_third)), right_third, 1)[0]
-            
-            # Left should descend, right should ascend
-            if left_slope >= 0 or right_slope <= 0:
-                continue
-            
-            # Check symmetry
-            if abs(abs(left_slope) - abs(right_slope)) / abs(left_slope) > 0.5:
-                continue
-            
-            bottom_level = np.min(window)
-            entry_level = lows[i]
-            exit_level = lows[i + window_size - 1]
-            
-            # Calculate confidence based on symmetry
-            confidence = 1.0 - (abs(abs(left_slope) - abs(right_slope)) / abs(left_slope))
-            
-            pattern = Pattern(
-                pattern_type="Rounding Bottom",
-                confidence=confidence,
-                start_idx=i,
-                end_idx=i + window_size - 1,
-                key_levels={
-                    "bottom": bottom_level,
-                    "entry": entry_level,
-                    "current": exit_level
-                },
-                description=f"Bullish Rounding Bottom: Bottom={bottom_level:.2f}, Current={exit_level:.2f}"
-            )
-            patterns.append(pattern)
-        
-        return patterns
+        lows = _as_prices(lows)
+        starts, bottoms, confidences = _rounding_bottom_kernel(lows, window_size)
+        ends = starts + window_size - 1
+        
+        return PatternBatch.from_columns(
+            PATTERN_TYPE_CODES["Rounding Bottom"], confidences, starts, ends,
+            bottoms, lows[starts], lows[ends]
+        )
     
     def detect_spike_pattern(self, highs: np.ndarray, lows: np.ndarray, 
-                            closes: np.ndarray) -> List[Pattern]:
+                            closes: np.ndarray) -> PatternBatch:
         """
         Detect Spike (V) pattern - sharp reversal
         Rapid price movement followed by immediate reversal
         """
-        patterns = []
         n = len(closes)
         
         if n < 10:
-            return patterns
+            return PatternBatch.empty()
         
-        # Look for sharp V-shaped reversals
-        for i in range(5, n - 5):
-            # Calculate price velocity before and after
-            before_change = (closes[i] - closes[i - 5]) / closes[i - 5]
-            after_change = (closes[i + 5] - closes[i]) / closes[i]
-            
-            # Bullish V: Sharp drop followed by sharp rise
-            if before_change < -0.05 and after_change > 0.05:
-                spike_low = lows[i]
-                confidence = min(abs(before_change), abs(after_change)) / 0.1
-                
-                pattern = Pattern(
-                    pattern_type="Spike V (Bullish)",
-                    confidence=min(confidence, 1.0),
-                    start_idx=i - 5,
-                    end_idx=i + 5,
-                    key_levels={
-                        "spike_low": spike_low,
-                        "entry": closes[i - 5],
-                        "exit": closes[i + 5]
-                    },
-                    description=f"Bullish Spike: Low={spike_low:.2f}, Recovery={after_change*100:.1f}%"
-                )
-                patterns.append(pattern)
-            
-            # Bearish Inverse V: Sharp rise followed by sharp drop
-            elif before_change > 0.05 and after_change < -0.05:
-                spike_high = highs[i]
-                confidence = min(abs(before_change), abs(after_change)) / 0.1
-                
-                pattern = Pattern(
-                    pattern_type="Spike V (Bearish)",
-                    confidence=min(confidence, 1.0),
-                    start_idx=i - 5,
-                    end_idx=i + 5,
-                    key_levels={
-                        "spike_high": spike_high,
-                        "entry": closes[i - 5],
-                        "exit": closes[i + 5]
-                    },
-                    description=f"Bearish Spike: High={spike_high:.2f}, Drop={after_change*100:.1f}%"
-                )
-                patterns.append(pattern)
-        
-        return patterns
+        # Price velocity over the 5 bars before and after every candidate i
+        start_closes = closes[:n - 10]
+        pivot_closes = closes[5:n - 5]
+        end_closes = closes[10:]
+        before_change = (pivot_closes - start_closes) / start_closes
+        after_change = (end_closes - pivot_closes) / pivot_closes
+        
+        # Bullish V: sharp drop then sharp rise; bearish inverse V: the reverse
+        bullish = (before_change < -0.05) & (after_change > 0.05)
+        bearish = (before_change > 0.05) & (after_change < -0.05)
+        
+        hits = np.flatnonzero(bullish | bearish)
+        confidences = np.minimum(
+            np.minimum(np.abs(before_change[hits]), np.abs(after_change[hits])) / 0.1, 1.0
+        )
+        
+        # A bullish spike's key level is the pivot's low, a bearish one's its high
+        pivots = hits + 5
+        is_bullish = bullish[hits]
+        codes = np.where(is_bullish, PATTERN_TYPE_CODES["Spike V (Bullish)"],
+                         PATTERN_TYPE_CODES["Spike V (Bearish)"])
+        extremes = np.where(is_bullish, lows[pivots], highs[pivots])
+        
+        return PatternBatch.from_columns(
+            codes, confidences, hits, hits + 10,
+            extremes, closes[hits], closes[hits + 10], closes[pivots]
+        )
     
     # Helper methods
     def _is_local_peak(self, data: np.ndarray, idx: int, window: int = 3) -> bool:
@@ -584,25 +1173,102 @@ class ReversalPatternDetector:
         if idx < window or idx >= len(data) - window:
             return False
         
-        local_data = data[idx - window:idx + window + 1]
-        return data[idx] == np.max(local_data)
+        return int(np.argmax(data[idx - window:idx + window + 1])) == window
     
     def _is_local_trough(self, data: np.ndarray, idx: int, window: int = 3) -> bool:
         """Check if index is a local trough"""
         if idx < window or idx >= len(data) - window:
             return False
         
-        local_data = data[idx - window:idx + window + 1]
-        return data[idx] == np.min(local_data)
+        return int(np.argmin(data[idx - window:idx + window + 1])) == window
     
     def _calculate_hs_confidence(self, head: float, left_shoulder: float, 
                                  right_shoulder: float, shoulder_diff: float) -> float:
         """Calculate confidence for H&S pattern"""
-        # Higher confidence if shoulders are more symmetric
-        symmetry_score = 1.0 - shoulder_diff
+        return _hs_confidence(head, left_shoulder, right_shoulder, shoulder_diff)
+
+
+class PatternStream:
+    """Incremental pattern detection over one symbol/timeframe's bars"""
+    
+    def __init__(self, detector: ReversalPatternDetector):
+        """
+        Initialize an empty stream
+        
+        Args:
+            detector: Detector used for every (partial) scan
+        """
+        self.detector = detector
+        self._timestamps: Optional[np.ndarray] = None
+        self._batch: Optional[PatternBatch] = None
+    
+    def update(self, timestamps: np.ndarray, highs: np.ndarray, lows: np.ndarray,
+               closes: np.ndarray) -> PatternBatch:
+        """
+        Detect patterns in the latest window of bars
+        
+        When the window is the previous one plus newer bars (its oldest
+        bars may have rolled off), only the last PATTERN_SPAN +
+        PATTERN_CONTEXT bars before the first new or revised bar are
+        re-scanned. Patterns that started earlier than that cannot have
+        changed and are carried over from the previous call (including ones
+        near the window start whose left context has since rolled off).
+        
+        Args:
+            timestamps: Bar open times, ascending
+            highs: Array of high prices
+            lows: Array of low prices
+            closes: Array of close prices
+            
+        Returns:
+            PatternBatch for the whole window
+        """
+        n = len(timestamps)
+        shift, changed = self._overlap(timestamps)
+        start = changed - PATTERN_SPAN - PATTERN_CONTEXT
+        
+        if start <= 0:
+            batch = self.detector.detect_all_patterns(highs, lows, closes)
+        else:
+            # Settled patterns from the last call, re-indexed for this window
+            starts = self._batch.start_idx - shift
+            settled = (starts >= 0) & (starts < changed - PATTERN_SPAN)
+            kept = self._batch.take(settled).shifted(-shift)
+            
+            # Re-scan the tail (at least min_bars of it, so the detector does
+            # not skip it); bars before start + PATTERN_CONTEXT only give context
+            scan = max(0, min(start, n - self.detector.min_bars))
+            tail = self.detector.detect_all_patterns(highs[scan:n], lows[scan:n],
+                                                     closes[scan:n])
+            tail = tail.take(tail.start_idx >= start + PATTERN_CONTEXT - scan).shifted(scan)
+            
+            batch = PatternBatch.concat([kept, tail])
+        
+        self._timestamps = np.array(timestamps, dtype=np.int64)
+        self._batch = batch
+        return batch
+    
+    def _overlap(self, timestamps: np.ndarray) -> Tuple[int, int]:
+        """
+        Line up a window with the previous one
+        
+        Args:
+            timestamps: Bar open times of the new window
+            
+        Returns:
+            (bars the window moved forward by, index of the first bar that
+            may differ from the previous call; 0 if nothing can be reused)
+        """
+        old = self._timestamps
+        if old is None or len(timestamps) == 0:
+            return 0, 0
         
-        # Higher confidence if head is significantly different from shoulders
-        head_prominence = abs(head - (left_shoulder + right_shoulder) / 2) / head
-        prominence_score = min(head_prominence / 0.05, 1.0)
+        shift = int(np.searchsorted(old, timestamps[0]))
+        if shift == len(old) or old[shift] != timestamps[0]:
+            return 0, 0
         
-        return (symmetry_score * 0.6 + prominence_score * 0.4)
+        # The previous last bar may have still been forming, so it counts as changed
+        overlap = min(len(old) - shift, len(timestamps))
+        if not np.array_equal(old[shift:shift + overlap], timestamps[:overlap]):
+            return 0, 0
+        return shift, min(len(old) - 1 - shift, overlap)
@@ -2,7 +2,7 @@
 Quick Start Guide for GOLD/USD Reversal Bot
 """
 
-print("""
+GUIDE = """
 ╔══════════════════════════════════════════════════════════════╗
 ║         GOLD/USD REVERSAL PATTERN DETECTION BOT             ║
 ╚══════════════════════════════════════════════════════════════╝
@@ -48,7 +48,7 @@ TELEGRAM_CHAT_ID=your_chat_id_here
 EXCHANGE=oanda
 SYMBOLS=XAU/USD
 TIMEFRAMES=15m,1h,4h
-SCAN_INTERVAL=60
+PRICE_CACHE_TTL=60
 MIN_CONFIDENCE=0.7
 
 ═══════════════════════════════════════════════════════════════
@@ -98,4 +98,13 @@ python main.py
 For more information, see README.md
 
 Good luck trading! 📈
-""")
+"""
+
+
+def main():
+    """Print the quick start guide"""
+    print(GUIDE)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Tests for the OHLCV bar cache
+Checks how fetched bars are merged into (and extend) the cached window
+"""
+import numpy as np
+from data_fetcher import DataFetcher
+
+
+TF_MS = 60_000
+
+
+def _rows(first, count, close=100.0):
+    """ccxt-style OHLCV rows for consecutive one-minute bars"""
+    return [[(first + i) * TF_MS, close, close + 1, close - 1, close, 10.0]
+            for i in range(count)]
+
+
+def _cache(count):
+    """Cached (N, 6) bars 0..count-1"""
+    return np.array(_rows(0, count), dtype=np.float64)
+
+
+def test_merge_no_new_bars():
+    """An empty fetch leaves the cache as it is"""
+    cached = _cache(5)
+    merged, changed = DataFetcher._merge_bars(cached, [], 5)
+    assert not changed
+    np.testing.assert_array_equal(merged, _cache(5))
+
+
+def test_merge_unchanged_last_bar():
+    """Re-fetching an identical last bar reports no change"""
+    cached = _cache(5)
+    merged, changed = DataFetcher._merge_bars(cached, _rows(4, 1), 5)
+    assert not changed
+    np.testing.assert_array_equal(merged, _cache(5))
+
+
+def test_merge_one_new_bar_rolls_in_place():
+    """A new bar drops the oldest one, reusing the cached buffer"""
+    cached = _cache(5)
+    merged, changed = DataFetcher._merge_bars(cached, _rows(4, 2), 5)
+    assert changed
+    assert merged is cached
+    np.testing.assert_array_equal(merged[:, 0], np.arange(1, 6) * TF_MS)
+
+
+def test_merge_revised_last_bar():
+    """A last bar that moved since it was cached is overwritten"""
+    cached = _cache(5)
+    merged, changed = DataFetcher._merge_bars(cached, _rows(4, 1, close=105.0), 5)
+    assert changed
+    np.testing.assert_array_equal(merged[:, 0], np.arange(5) * TF_MS)
+    assert merged[-1, 4] == 105.0
+    assert merged[-2, 4] == 100.0
+
+
+def test_merge_gap_larger_than_buffer():
+    """More new bars than the window keeps only the newest of them"""
+    cached = _cache(5)
+    merged, changed = DataFetcher._merge_bars(cached, _rows(10, 7), 5)
+    assert changed
+    np.testing.assert_array_equal(merged[:, 0], np.arange(12, 17) * TF_MS)
+
+
+def test_merge_short_cache_grows():
+    """A cache shorter than the window is extended, not rolled"""
+    cached = _cache(3)
+    merged, changed = DataFetcher._merge_bars(cached, _rows(2, 2), 5)
+    assert changed
+    np.testing.assert_array_equal(merged[:, 0], np.arange(4) * TF_MS)
+
+
+def test_delta_since():
+    """The cache is extended only when one request can bridge the gap"""
+    fetcher = DataFetcher('binance', cache_dir=None, load_markets=False)
+    now = fetcher.exchange.milliseconds()
+    
+    fresh = _cache(5)
+    fresh[:, 0] = now - np.arange(5)[::-1] * TF_MS
+    assert fetcher._delta_since(fresh, '1m', 5) == int(fresh[-1, 0])
+    
+    stale = fresh.copy()
+    stale[:, 0] -= 10 * TF_MS
+    assert fetcher._delta_since(stale, '1m', 5) is None
+    
+    assert fetcher._delta_since(None, '1m', 5) is None
+    assert fetcher._delta_since(fresh[:3], '1m', 5) is None
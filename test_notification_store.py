@@ -0,0 +1,48 @@
+"""
+Tests for the sent-alert store
+Checks that alerts survive a reopen and are loaded/pruned by age
+"""
+from notification_store import NotificationStore
+
+
+def test_save_and_load(tmp_path):
+    """Saved alerts are loaded back (after a reopen), oldest first"""
+    path = tmp_path / 'notified.db'
+    store = NotificationStore(path)
+    store.save([(('XAU/USD', '1h', 'Double Top', 2000), 20.0),
+                (('XAU/USD', '4h', 'Triple Bottom', 1000), 10.0)])
+    store.close()
+    
+    store = NotificationStore(path)
+    assert store.load(0.0) == [
+        (('XAU/USD', '4h', 'Triple Bottom', 1000), 10.0),
+        (('XAU/USD', '1h', 'Double Top', 2000), 20.0),
+    ]
+    assert store.load(15.0) == [(('XAU/USD', '1h', 'Double Top', 2000), 20.0)]
+    store.close()
+
+
+def test_save_replaces_same_id(tmp_path):
+    """Saving an id again updates its sent time instead of duplicating it"""
+    store = NotificationStore(tmp_path / 'notified.db')
+    alert_id = ('XAU/USD', '1h', 'Double Top', 2000)
+    store.save([(alert_id, 10.0)])
+    store.save([(alert_id, 30.0)])
+    assert store.load(0.0) == [(alert_id, 30.0)]
+    store.close()
+
+
+def test_prune(tmp_path):
+    """Pruning drops old alerts, optionally only on one timeframe"""
+    store = NotificationStore(tmp_path / 'notified.db')
+    store.save([(('XAU/USD', '1h', 'Double Top', 1), 10.0),
+                (('XAU/USD', '4h', 'Double Top', 1), 10.0),
+                (('XAU/USD', '1h', 'Double Top', 2), 50.0)])
+    
+    store.prune(20.0, '1h')
+    assert store.load(0.0) == [(('XAU/USD', '4h', 'Double Top', 1), 10.0),
+                               (('XAU/USD', '1h', 'Double Top', 2), 50.0)]
+    
+    store.prune(20.0)
+    assert store.load(0.0) == [(('XAU/USD', '1h', 'Double Top', 2), 50.0)]
+    store.close()
@@ -0,0 +1,72 @@
+"""
+Tests for incremental pattern detection
+Checks PatternStream against a full re-scan of every rolling window
+"""
+import numpy as np
+from pattern_detector import PATTERN_CONTEXT, PatternStream, ReversalPatternDetector
+
+
+def _keys(batch, min_start=0):
+    """Comparable (type, start, end, confidence, levels) rows of a batch"""
+    return {
+        (p.pattern_type, p.start_idx, p.end_idx, round(p.confidence, 9),
+         tuple(round(v, 9) for v in p.key_levels.values()))
+        for p in batch if p.start_idx >= min_start
+    }
+
+
+def _series(rng, n, quantized):
+    """Random-walk highs/lows/closes (rounded closes give plateaus and ties)"""
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    if quantized:
+        closes = np.round(closes)
+    return closes * 1.003, closes * 0.997, closes
+
+
+def test_stream_matches_full_rescan():
+    """Rolling windows (with a revised forming bar) match a full scan"""
+    rng = np.random.default_rng(5)
+    
+    for trial in range(6):
+        n = 400
+        highs, lows, closes = _series(rng, n, quantized=trial % 2 == 1)
+        timestamps = np.arange(n, dtype=np.int64) * 60_000
+        detector = ReversalPatternDetector(tolerance=0.03)
+        stream = PatternStream(detector)
+        window = (100, 150, 200)[trial % 3]
+        
+        end = window
+        while end < n:
+            h = highs[end - window:end].copy()
+            l = lows[end - window:end].copy()
+            c = closes[end - window:end].copy()
+            
+            # The newest bar may still be forming and move between scans
+            if rng.random() < 0.5:
+                h[-1] *= 1.001
+                c[-1] *= 1.0005
+            
+            full = detector.detect_all_patterns(h, l, c)
+            incremental = stream.update(timestamps[end - window:end], h, l, c)
+            
+            # Patterns whose left context rolled off are carried over, so only
+            # the part of the window with full context must match exactly
+            assert _keys(incremental, PATTERN_CONTEXT) == _keys(full, PATTERN_CONTEXT)
+            assert all(0 <= p.start_idx <= p.end_idx < window for p in incremental)
+            
+            end += int(rng.choice([0, 1, 1, 2, 5, 30]))
+
+
+def test_stream_first_update_and_reset_are_full_scans():
+    """A first window, or one not overlapping the last, is scanned in full"""
+    rng = np.random.default_rng(1)
+    highs, lows, closes = _series(rng, 300, quantized=False)
+    timestamps = np.arange(300, dtype=np.int64) * 60_000
+    detector = ReversalPatternDetector(tolerance=0.03)
+    stream = PatternStream(detector)
+    
+    first = stream.update(timestamps[:100], highs[:100], lows[:100], closes[:100])
+    assert _keys(first) == _keys(detector.detect_all_patterns(highs[:100], lows[:100], closes[:100]))
+    
+    jumped = stream.update(timestamps[200:], highs[200:], lows[200:], closes[200:])
+    assert _keys(jumped) == _keys(detector.detect_all_patterns(highs[200:], lows[200:], closes[200:]))
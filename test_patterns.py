@@ -2,96 +2,118 @@
 Test script for pattern detection
 Tests pattern detection algorithms with sample data
 """
+import io
+import sys
+from functools import lru_cache
+
 import numpy as np
 from pattern_detector import ReversalPatternDetector
 
 
-def generate_head_and_shoulders_data():
-    """Generate synthetic H&S pattern"""
+def _frozen(*arrays):
+    """Mark cached arrays read-only so callers can't alter them for others"""
+    for array in arrays:
+        array.flags.writeable = False
+    return arrays
+
+
+@lru_cache(maxsize=None)
+def generate_head_and_shoulders_data(seed: int = 0):
+    """Generate synthetic H&S pattern (cached per seed)"""
+    rng = np.random.default_rng(seed)
     # Left shoulder
-    left = [100, 105, 110, 108, 105, 102, 100]
+    left = np.array([100, 105, 110, 108, 105, 102, 100], dtype=np.float64)
     # Head
-    head = [102, 108, 115, 120, 118, 112, 105]
+    head = np.array([102, 108, 115, 120, 118, 112, 105], dtype=np.float64)
     # Right shoulder
-    right = [107, 110, 108, 105, 102, 100, 98]
+    right = np.array([107, 110, 108, 105, 102, 100, 98], dtype=np.float64)
     
-    prices = left + head + right
-    highs = np.array([p + np.random.uniform(0, 2) for p in prices])
-    lows = np.array([p - np.random.uniform(0, 2) for p in prices])
-    closes = np.array(prices)
+    closes = np.concatenate((left, head, right))
+    highs = closes + rng.uniform(0, 2, closes.size)
+    lows = closes - rng.uniform(0, 2, closes.size)
     
-    return highs, lows, closes
+    return _frozen(highs, lows, closes)
 
 
-def generate_double_bottom_data():
-    """Generate synthetic double bottom pattern"""
-    prices = [100, 95, 90, 85, 88, 92, 95, 93, 90, 87, 85, 88, 92, 97, 100]
+@lru_cache(maxsize=None)
+def generate_double_bottom_data(seed: int = 0):
+    """Generate synthetic double bottom pattern (cached per seed)"""
+    rng = np.random.default_rng(seed)
+    prices = np.asarray([100, 95, 90, 85, 88, 92, 95, 93, 90, 87, 85, 88, 92, 97, 100],
+                        dtype=np.float64)
     
-    highs = np.array([p + np.random.uniform(0, 2) for p in prices])
-    lows = np.array([p - np.random.uniform(0, 2) for p in prices])
-    closes = np.array(prices)
+    highs = prices + rng.uniform(0, 2, prices.size)
+    lows = prices - rng.uniform(0, 2, prices.size)
+    closes = prices
     
-    return highs, lows, closes
+    return _frozen(highs, lows, closes)
 
 
-def generate_spike_pattern_data():
-    """Generate synthetic spike V pattern"""
+@lru_cache(maxsize=None)
+def generate_spike_pattern_data(seed: int = 0):
+    """Generate synthetic spike V pattern (cached per seed)"""
+    rng = np.random.default_rng(seed)
     # Sharp drop then sharp recovery
-    prices = [100, 98, 95, 90, 85, 80, 85, 90, 95, 100, 105]
+    prices = np.asarray([100, 98, 95, 90, 85, 80, 85, 90, 95, 100, 105], dtype=np.float64)
     
-    highs = np.array([p + np.random.uniform(0, 1) for p in prices])
-    lows = np.array([p - np.random.uniform(0, 1) for p in prices])
-    closes = np.array(prices)
+    highs = prices + rng.uniform(0, 1, prices.size)
+    lows = prices - rng.uniform(0, 1, prices.size)
+    closes = prices
     
-    return highs, lows, closes
+    return _frozen(highs, lows, closes)
 
 
 def test_pattern_detection():
     """Test pattern detection with synthetic data"""
     detector = ReversalPatternDetector(tolerance=0.03, min_bars=5)
     
-    print("\n" + "="*60)
-    print("PATTERN DETECTION TEST")
-    print("="*60)
+    # Collect the report and write it once at the end
+    out = io.StringIO()
+    
+    print("\n" + "="*60, file=out)
+    print("PATTERN DETECTION TEST", file=out)
+    print("="*60, file=out)
     
     # Test Head & Shoulders
-    print("\n1. Testing Head & Shoulders Detection...")
+    print("\n1. Testing Head & Shoulders Detection...", file=out)
     highs, lows, closes = generate_head_and_shoulders_data()
     patterns = detector.detect_head_and_shoulders(highs, lows, closes)
-    print(f"   Found {len(patterns)} H&S pattern(s)")
+    print(f"   Found {len(patterns)} H&S pattern(s)", file=out)
     for p in patterns:
-        print(f"   - {p.description}")
-        print(f"     Confidence: {p.confidence*100:.1f}%")
+        print(f"   - {p.description}", file=out)
+        print(f"     Confidence: {p.confidence*100:.1f}%", file=out)
     
     # Test Double Bottom
-    print("\n2. Testing Double Bottom Detection...")
+    print("\n2. Testing Double Bottom Detection...", file=out)
     highs, lows, closes = generate_double_bottom_data()
     patterns = detector.detect_double_bottom(lows, closes)
-    print(f"   Found {len(patterns)} Double Bottom pattern(s)")
+    print(f"   Found {len(patterns)} Double Bottom pattern(s)", file=out)
     for p in patterns:
-        print(f"   - {p.description}")
-        print(f"     Confidence: {p.confidence*100:.1f}%")
+        print(f"   - {p.description}", file=out)
+        print(f"     Confidence: {p.confidence*100:.1f}%", file=out)
     
     # Test Spike Pattern
-    print("\n3. Testing Spike V Pattern Detection...")
+    print("\n3. Testing Spike V Pattern Detection...", file=out)
     highs, lows, closes = generate_spike_pattern_data()
     patterns = detector.detect_spike_pattern(highs, lows, closes)
-    print(f"   Found {len(patterns)} Spike pattern(s)")
+    print(f"   Found {len(patterns)} Spike pattern(s)", file=out)
     for p in patterns:
-        print(f"   - {p.description}")
-        print(f"     Confidence: {p.confidence*100:.1f}%")
+        print(f"   - {p.description}", file=out)
+        print(f"     Confidence: {p.confidence*100:.1f}%", file=out)
     
     # Test all patterns together
-    print("\n4. Testing All Patterns Detection...")
+    print("\n4. Testing All Patterns Detection...", file=out)
     highs, lows, closes = generate_head_and_shoulders_data()
     all_patterns = detector.detect_all_patterns(highs, lows, closes)
-    print(f"   Total patterns found: {len(all_patterns)}")
+    print(f"   Total patterns found: {len(all_patterns)}", file=out)
     for p in all_patterns:
-        print(f"   - {p.pattern_type}: {p.confidence*100:.1f}% confidence")
+        print(f"   - {p.pattern_type}: {p.confidence*100:.1f}% confidence", file=out)
+    
+    print("\n" + "="*60, file=out)
+    print("✓ Pattern detection tests completed!", file=out)
+    print("="*60 + "\n", file=out)
     
-    print("\n" + "="*60)
-    print("✓ Pattern detection tests completed!")
-    print("="*60 + "\n")
+    sys.stdout.write(out.getvalue())
 
 
 if __name__ == "__main__":